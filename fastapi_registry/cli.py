@@ -1,16 +1,16 @@
 """CLI for FastAPI Blocks Registry."""
 
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
-from rich import print as rprint
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
-from fastapi_registry.core.installer import ModuleInstaller
-from fastapi_registry.core.project_initializer import ProjectInitializer
-from fastapi_registry.core.registry_manager import RegistryManager
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from fastapi_registry.core.project_initializer import ProjectInitializer
+    from fastapi_registry.core.registry_manager import RegistryManager
 
 # Initialize Typer app
 app = typer.Typer(
@@ -27,16 +27,58 @@ def version_callback(value: bool) -> None:
         raise typer.Exit()
 
 
-# Initialize Rich console
-console = Console()
+@lru_cache
+def _console() -> "Console":
+    """Get the shared Rich console, importing Rich only when output is needed."""
+    from rich.console import Console
+
+    return Console()
+
 
 # Get the path to the registry.json file
 REGISTRY_PATH = Path(__file__).parent / "registry.json"
 REGISTRY_BASE_PATH = Path(__file__).parent
 
 
+@lru_cache(maxsize=4)
+def _get_registry(path: str, mtime: float) -> "RegistryManager":
+    """
+    Get a cached registry manager for the given registry file.
+
+    The file modification time is part of the cache key, so an edited
+    registry.json is re-parsed automatically.
+
+    Args:
+        path: Path to registry.json file
+        mtime: Modification time of the registry file
+
+    Returns:
+        RegistryManager instance
+    """
+    from fastapi_registry.core.registry_manager import RegistryManager
+
+    return RegistryManager(Path(path))
+
+
+def _load_registry() -> "RegistryManager":
+    """Load the bundled registry, reusing the parsed result when unchanged."""
+    if not REGISTRY_PATH.exists():
+        raise FileNotFoundError(f"Registry not found: {REGISTRY_PATH}")
+    return _get_registry(str(REGISTRY_PATH), REGISTRY_PATH.stat().st_mtime)
+
+
+@lru_cache
+def _get_initializer() -> "ProjectInitializer":
+    """Get the shared project initializer (its template scans are cached)."""
+    from fastapi_registry.core.project_initializer import ProjectInitializer
+
+    return ProjectInitializer(REGISTRY_BASE_PATH)
+
+
 def _print_version() -> None:
     """Print CLI version and description consistently."""
+    from rich import print as rprint
+
     from fastapi_registry import __description__, __version__
 
     rprint(f"\n[bold cyan]FastAPI Blocks Registry[/bold cyan] [yellow]v{__version__}[/yellow]")
@@ -61,8 +103,11 @@ def common_options(
 @app.command(name="list")
 def list_modules(search: str | None = typer.Option(None, "--search", "-s", help="Search modules by name or description")) -> None:
     """List all available modules in the registry."""
+    from rich.table import Table
+
+    console = _console()
     try:
-        registry = RegistryManager(REGISTRY_PATH)
+        registry = _load_registry()
 
         if search:
             modules = registry.search_modules(search)
@@ -74,12 +119,16 @@ def list_modules(search: str | None = typer.Option(None, "--search", "-s", help=
             modules = registry.list_modules()
             console.print("\n[bold]Available modules:[/bold]\n")
 
+        # Precompute widths of the short, non-wrapping columns so Rich does not measure them
+        module_width = max([len("Module")] + [len(module_name) for module_name in modules])
+        version_width = max([len("Version")] + [len(metadata.version) for metadata in modules.values()])
+
         # Create a table
         table = Table(show_header=True, header_style="bold cyan")
-        table.add_column("Module", style="green", no_wrap=True)
+        table.add_column("Module", style="green", no_wrap=True, width=module_width)
         table.add_column("Name", style="white")
         table.add_column("Description")
-        table.add_column("Version", justify="center", style="yellow")
+        table.add_column("Version", justify="center", style="yellow", no_wrap=True, width=version_width)
 
         for module_name, metadata in modules.items():
             table.add_row(module_name, metadata.name, metadata.description, metadata.version)
@@ -98,8 +147,11 @@ def list_modules(search: str | None = typer.Option(None, "--search", "-s", help=
 @app.command()
 def info(module_name: str) -> None:
     """Show detailed information about a module."""
+    from rich.panel import Panel
+
+    console = _console()
     try:
-        registry = RegistryManager(REGISTRY_PATH)
+        registry = _load_registry()
         module = registry.get_module(module_name)
 
         if not module:
@@ -159,8 +211,11 @@ def add(
     yes: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation prompts"),
 ) -> None:
     """Add a module to your FastAPI project."""
+    from fastapi_registry.core.installer import ModuleInstaller
+
+    console = _console()
     try:
-        registry = RegistryManager(REGISTRY_PATH)
+        registry = _load_registry()
         module = registry.get_module(module_name)
 
         if not module:
@@ -217,6 +272,7 @@ def remove(
     yes: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation prompts"),
 ) -> None:
     """Remove a module from your FastAPI project."""
+    console = _console()
     try:
         # Determine project path
         if project_path is None:
@@ -261,9 +317,12 @@ def _install_all_modules(project_path: Path) -> None:
     Args:
         project_path: Path to the FastAPI project
     """
+    from fastapi_registry.core.installer import ModuleInstaller
+
+    console = _console()
     console.print("\n[bold cyan]Installing all available modules...[/bold cyan]\n")
 
-    registry = RegistryManager(REGISTRY_PATH)
+    registry = _load_registry()
     installer = ModuleInstaller(registry, REGISTRY_BASE_PATH)
 
     # Sort modules by dependencies
@@ -322,10 +381,13 @@ def _do_init_project(
         force: If True, overwrite existing files
         all_modules: If True, install all available modules after initialization
     """
+    from fastapi_registry.core.file_utils import is_directory_empty
+
+    console = _console()
     project_path = project_path.resolve()
 
     # Validate project name if provided
-    initializer = ProjectInitializer(REGISTRY_BASE_PATH)
+    initializer = _get_initializer()
     if name and not initializer.validate_project_name(name):
         console.print("[red]Error:[/red] Invalid project name. " "Must start with a letter and contain only alphanumeric characters, underscores, or hyphens.")
         raise typer.Exit(1)
@@ -338,7 +400,7 @@ def _do_init_project(
     console.print()
 
     # Check if directory is not empty
-    if project_path.exists() and any(project_path.iterdir()) and not force:
+    if project_path.exists() and not is_directory_empty(project_path) and not force:
         console.print("[yellow]Warning:[/yellow] Directory is not empty.")
         if not typer.confirm("Initialize anyway?", default=False):
             console.print("[yellow]Cancelled.[/yellow]")
@@ -419,7 +481,7 @@ def _do_init_project(
 
 
 def _sort_modules_by_dependencies(
-    registry: RegistryManager,
+    registry: "RegistryManager",
 ) -> list[str]:
     """
     Sort modules by their dependencies (topological sort).
@@ -489,6 +551,7 @@ def _run_init_with_error_handling(
         force: If True, overwrite existing files
         all_modules: If True, install all available modules after initialization
     """
+    console = _console()
     try:
         # Determine project path
         if project_path is None:
@@ -1,5 +1,6 @@
 """File manipulation utilities for module installation."""
 
+import os
 import re
 import shutil
 from pathlib import Path
@@ -37,6 +38,12 @@ def ensure_directory_exists(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+def is_directory_empty(path: Path) -> bool:
+    """Check if directory has no entries (stops at the first entry found)."""
+    with os.scandir(path) as entries:
+        return next(entries, None) is None
+
+
 def read_file(file_path: Path) -> str:
     """Read file content as string."""
     with open(file_path, encoding="utf-8") as f:
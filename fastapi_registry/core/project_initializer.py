@@ -1,10 +1,110 @@
 """Project initialization utilities."""
 
+import base64
+import os
 import re
-import secrets
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+from fastapi_registry.core.file_utils import is_directory_empty
+
+# Number of threads used for copying/writing project files (I/O bound)
+MAX_IO_WORKERS = 8
+
+# .j2 templates and their destinations relative to the project root
+J2_TEMPLATES: tuple[tuple[str, str], ...] = (
+    ("README.md.j2", "README.md"),
+    ("env.j2", ".env"),
+    ("config.py.j2", "app/core/config.py"),
+    # Docker templates
+    ("docker-compose.yml.j2", "docker-compose.yml"),
+    ("docker-compose.dev.yml.j2", "docker-compose.dev.yml"),
+    ("Dockerfile.j2", "Dockerfile"),
+    ("Dockerfile.dev.j2", "Dockerfile.dev"),
+)
+
+# example_project files that have .j2 template equivalents (processed separately)
+TEMPLATED_FILES = frozenset(
+    {
+        "README.md",  # -> templates_j2/README.md.j2
+        ".env",  # -> templates_j2/env.j2
+        "app/core/config.py",  # -> templates_j2/config.py.j2
+    }
+)
+
+# example_project directories to exclude (modules and common utils are added separately by users)
+EXCLUDED_DIRS: tuple[str, ...] = (
+    "app/modules",  # Modules are added with 'fastapi-registry add <module>'
+    "app/common",  # Common utilities added as dependencies when needed
+)
+
+
+@lru_cache(maxsize=32)
+def _read_template(template_path: Path) -> bytes:
+    """
+    Read a template file, caching its content for repeated initializations.
+
+    Content is kept as raw bytes: placeholders are ASCII, so substitution
+    works without decoding/encoding the whole template.
+
+    Args:
+        template_path: Path to the template file
+
+    Returns:
+        Template content
+    """
+    return template_path.read_bytes()
+
+
+@lru_cache(maxsize=8)
+def _placeholder_pattern(keys: tuple[bytes, ...]) -> re.Pattern[bytes]:
+    """
+    Build a regex matching any {key} placeholder for the given variable names.
+
+    Args:
+        keys: Template variable names
+
+    Returns:
+        Compiled pattern capturing the variable name
+    """
+    return re.compile(rb"\{(" + b"|".join(map(re.escape, keys)) + rb")\}")
+
+
+@lru_cache(maxsize=4)
+def _scan_example_project(example_project_path: Path) -> tuple[Path, ...]:
+    """
+    List example_project files to copy into new projects.
+
+    os.walk reports files and directories from the directory listing itself
+    (no per-entry stat), and excluded directories are pruned so they are never
+    scanned. The result is cached, so repeated initializations in one process
+    reuse it.
+
+    Args:
+        example_project_path: Path to the example_project directory
+
+    Returns:
+        File paths relative to example_project
+    """
+    files_to_copy: list[Path] = []
+    for root, dirs, files in os.walk(example_project_path):
+        rel_dir = Path(root).relative_to(example_project_path)
+
+        dirs[:] = [name for name in dirs if (rel_dir / name).as_posix() not in EXCLUDED_DIRS]
+
+        for name in files:
+            rel_path = rel_dir / name
+
+            # Skip if this file has a .j2 template version
+            if rel_path.as_posix() in TEMPLATED_FILES:
+                continue
+
+            files_to_copy.append(rel_path)
+
+    return tuple(files_to_copy)
+
 
 class ProjectInitializer:
     """Handles initialization of new FastAPI projects."""
@@ -47,7 +147,7 @@ class ProjectInitializer:
         project_path.mkdir(parents=True, exist_ok=True)
 
         # Check if directory is empty
-        if any(project_path.iterdir()) and not force:
+        if not is_directory_empty(project_path) and not force:
             raise FileExistsError(f"Directory {project_path} is not empty. " "Use --force to initialize anyway.")
 
         # Use directory name as project name if not provided
@@ -57,8 +157,8 @@ class ProjectInitializer:
         if project_description is None:
             project_description = f"A FastAPI application: {project_name}"
 
-        # Generate secure secret key
-        secret_key = secrets.token_urlsafe(32)
+        # Generate secure secret key (URL-safe, same as secrets.token_urlsafe(32))
+        secret_key = base64.urlsafe_b64encode(os.urandom(32)).rstrip(b"=").decode("ascii")
 
         # Generate Docker-related variables
         project_name_slug = self._slugify(project_name)
@@ -98,111 +198,101 @@ class ProjectInitializer:
             project_path: Destination path
             template_vars: Variables for template substitution
         """
-        # Files that have .j2 template equivalents (will be processed separately)
-        templated_files = {
-            "README.md",  # -> templates_j2/README.md.j2
-            ".env",  # -> templates_j2/env.j2
-            "app/core/config.py",  # -> templates_j2/config.py.j2
-        }
+        # Collect files to copy from example_project
+        copy_jobs = [(self.example_project_path / rel_path, project_path / rel_path) for rel_path in _scan_example_project(self.example_project_path)]
 
-        # Directories to exclude (modules and common utils are added separately by users)
-        exclude_dirs = {
-            "app/modules",  # Modules are added with 'fastapi-registry add <module>'
-            "app/common",  # Common utilities added as dependencies when needed
-        }
-
-        # Copy all files from example_project
-        for item in self.example_project_path.rglob("*"):
-            if not item.is_file():
-                continue
+        # Render .j2 templates (variable-free ones are copied verbatim)
+        rendered, verbatim = self._render_j2_templates(project_path, template_vars)
 
-            # Get relative path from example_project
-            rel_path = item.relative_to(self.example_project_path)
+        # Create every destination directory once (including the empty modules directory)
+        modules_path = project_path / "app" / "modules"
+        self._make_dirs({dest_path.parent for _, dest_path in copy_jobs + verbatim} | {dest_path.parent for dest_path in rendered} | {modules_path})
 
-            # Check if in excluded module directory
-            is_excluded = False
-            for exclude_dir in exclude_dirs:
-                if str(rel_path).startswith(exclude_dir):
-                    is_excluded = True
-                    break
-
-            if is_excluded:
-                continue
-
-            dest_path = project_path / rel_path
-
-            # Skip if this file has a .j2 template version
-            if str(rel_path) in templated_files:
-                continue
-
-            # Create parent directory
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Direct copy for non-template files
-            shutil.copy2(item, dest_path)
-
-        # Process .j2 templates
-        self._process_j2_templates(project_path, template_vars)
-
-        # Ensure empty modules directory exists
-        (project_path / "app" / "modules").mkdir(parents=True, exist_ok=True)
+        # Copy files and write rendered templates concurrently
+        with ThreadPoolExecutor(max_workers=MAX_IO_WORKERS) as executor:
+            list(executor.map(lambda job: shutil.copy2(*job), copy_jobs))
+            list(executor.map(lambda job: shutil.copyfile(*job), verbatim))
+            list(executor.map(lambda item: item[0].write_bytes(item[1]), rendered.items()))
 
         # Create __init__.py in modules if it doesn't exist
-        modules_init = project_path / "app" / "modules" / "__init__.py"
+        modules_init = modules_path / "__init__.py"
         if not modules_init.exists():
-            with open(modules_init, "w", encoding="utf-8") as f:
-                f.write(
-                    '"""FastAPI modules package.\n\n'
-                    "This directory contains all application modules (features).\n"
-                    "Each module is self-contained with its own:\n"
-                    "- models.py (database models)\n"
-                    "- schemas.py (Pydantic request/response schemas)\n"
-                    "- router.py (API endpoints)\n"
-                    "- service.py (business logic)\n"
-                    "- dependencies.py (FastAPI dependencies)\n"
-                    "- exceptions.py (module-specific exceptions)\n"
-                    '"""\n'
-                )
-
-    def _process_j2_templates(self, project_path: Path, template_vars: dict) -> None:
-        """
-        Process .j2 template files and write to destination.
+            modules_init.write_text(
+                '"""FastAPI modules package.\n\n'
+                "This directory contains all application modules (features).\n"
+                "Each module is self-contained with its own:\n"
+                "- models.py (database models)\n"
+                "- schemas.py (Pydantic request/response schemas)\n"
+                "- router.py (API endpoints)\n"
+                "- service.py (business logic)\n"
+                "- dependencies.py (FastAPI dependencies)\n"
+                "- exceptions.py (module-specific exceptions)\n"
+                '"""\n',
+                encoding="utf-8",
+            )
+
+    def _render_j2_templates(self, project_path: Path, template_vars: dict) -> tuple[dict[Path, bytes], list[tuple[Path, Path]]]:
+        """
+        Render .j2 template files in memory.
+
+        Templates without any placeholders are not rendered; they are returned
+        as (source, destination) pairs so they can be copied with shutil.copyfile,
+        which uses in-kernel copying where the platform supports it.
 
         Args:
             project_path: Destination path
             template_vars: Variables for substitution
+
+        Returns:
+            Tuple of (destination path -> rendered content, verbatim copy jobs)
         """
-        # Map of template files to destination paths
-        j2_templates = {
-            "README.md.j2": project_path / "README.md",
-            "env.j2": project_path / ".env",
-            "config.py.j2": project_path / "app" / "core" / "config.py",
-            # Docker templates
-            "docker-compose.yml.j2": project_path / "docker-compose.yml",
-            "docker-compose.dev.yml.j2": project_path / "docker-compose.dev.yml",
-            "Dockerfile.j2": project_path / "Dockerfile",
-            "Dockerfile.dev.j2": project_path / "Dockerfile.dev",
-        }
+        # Encode substitution values once for all templates
+        byte_vars = {key.encode("utf-8"): value.encode("utf-8") for key, value in template_vars.items()}
+        pattern = _placeholder_pattern(tuple(byte_vars))
+        rendered: dict[Path, bytes] = {}
+        verbatim: list[tuple[Path, Path]] = []
+
+        # One directory scan instead of an exists() check per template
+        with os.scandir(self.templates_j2_path) as entries:
+            available = {entry.name for entry in entries if entry.is_file()}
+
+        for template_name, dest_name in J2_TEMPLATES:
+            if template_name not in available:
+                # Skip if template doesn't exist (optional templates)
+                continue
 
-        for template_name, dest_path in j2_templates.items():
             template_path = self.templates_j2_path / template_name
 
-            if not template_path.exists():
-                # Skip if template doesn't exist (optional templates)
-                continue
+            if pattern.search(_read_template(template_path)) is None:
+                verbatim.append((template_path, project_path / dest_name))
+            else:
+                rendered[project_path / dest_name] = self._render(template_path, byte_vars)
+
+        return rendered, verbatim
+
+    def _render(self, template_path: Path, byte_vars: dict[bytes, bytes]) -> bytes:
+        """
+        Render a template by substituting {variable} placeholders.
 
-            # Read template content
-            with open(template_path, encoding="utf-8") as f:
-                content = f.read()
+        Args:
+            template_path: Path to the template file
+            byte_vars: UTF-8 encoded variable names and values
 
-            # Replace variables in content
-            for key, value in template_vars.items():
-                content = content.replace(f"{{{key}}}", value)
+        Returns:
+            Rendered content
+        """
+        pattern = _placeholder_pattern(tuple(byte_vars))
+        return pattern.sub(lambda match: byte_vars[match.group(1)], _read_template(template_path))
 
-            # Write to destination
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(dest_path, "w", encoding="utf-8") as f:
-                f.write(content)
+    def _make_dirs(self, directories: set[Path]) -> None:
+        """
+        Create directories, shortest paths first, issuing one mkdir per directory.
+
+        Args:
+            directories: Directories to create
+        """
+        for directory in sorted(directories, key=lambda path: len(path.parts)):
+            directory.mkdir(parents=True, exist_ok=True)
 
     def validate_project_name(self, name: str) -> bool:
         """
@@ -214,8 +304,8 @@ class ProjectInitializer:
         Returns:
             True if valid, False otherwise
         """
-        # Allow alphanumeric, underscore, hyphen
-        return bool(re.match(r"^[a-zA-Z][a-zA-Z0-9_-]*$", name))
+        # Must start with a letter; allow ASCII alphanumeric, underscore, hyphen
+        return name.isascii() and name[:1].isalpha() and all(c.isalnum() or c == "_" or c == "-" for c in name)
 
     def _slugify(self, name: str) -> str:
         """
@@ -1,14 +1,26 @@
 """Application factory for creating FastAPI app instances."""
 
+import logging
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
 
 from app.core.config import settings
 from app.core.middleware import setup_middleware
+from app.core.responses import ORJSONResponse
+
+logger = logging.getLogger(__name__)
+
+# Production 500 body is constant, so one response instance is shared by all requests
+INTERNAL_ERROR_RESPONSE = ORJSONResponse(
+    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+    content={
+        "error": "Internal Server Error",
+        "message": "An unexpected error occurred",
+    },
+)
 
 
 @asynccontextmanager
@@ -19,9 +31,6 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     Handles startup and shutdown events.
     """
     # Startup
-    import logging
-
-    logger = logging.getLogger(__name__)
     logger.info("Starting application", extra={"environment": settings.app.environment})
 
     # Initialize database (optional - uncomment if you want auto-init)
@@ -55,40 +64,44 @@ def create_app() -> FastAPI:
     Returns:
         Configured FastAPI application
     """
+    # Environment does not change at runtime, so evaluate it once per app
+    is_development = settings.is_development()
+
     app = FastAPI(
         title=settings.app.name,
         version=settings.app.version,
         debug=settings.app.debug,
         lifespan=lifespan,
-        docs_url="/api/docs" if settings.is_development() else None,
-        redoc_url="/api/redoc" if settings.is_development() else None,
-        openapi_url="/api/openapi.json" if settings.is_development() else None,
+        docs_url="/api/docs" if is_development else None,
+        redoc_url="/api/redoc" if is_development else None,
+        openapi_url="/api/openapi.json" if is_development else None,
     )
 
     # Setup middleware
     setup_middleware(app)
 
     # Register exception handlers
-    register_exception_handlers(app)
+    register_exception_handlers(app, is_development)
 
     # Register routers
-    register_routers(app)
+    register_routers(app, is_development)
 
     return app
 
 
-def register_exception_handlers(app: FastAPI) -> None:
+def register_exception_handlers(app: FastAPI, is_development: bool) -> None:
     """
     Register global exception handlers.
 
     Args:
         app: FastAPI application instance
+        is_development: Whether to include exception details in error responses
     """
 
     @app.exception_handler(RequestValidationError)
-    async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+    async def validation_exception_handler(request: Request, exc: RequestValidationError) -> ORJSONResponse:
         """Handle validation errors."""
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             content={
                 "error": "Validation Error",
@@ -98,15 +111,12 @@ def register_exception_handlers(app: FastAPI) -> None:
         )
 
     @app.exception_handler(Exception)
-    async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+    async def general_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
         """Handle unexpected errors."""
-        import logging
-
-        logger = logging.getLogger(__name__)
         logger.exception("Unhandled exception occurred")
 
-        if settings.is_development():
-            return JSONResponse(
+        if is_development:
+            return ORJSONResponse(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 content={
                     "error": "Internal Server Error",
@@ -115,21 +125,16 @@ def register_exception_handlers(app: FastAPI) -> None:
                 },
             )
 
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={
-                "error": "Internal Server Error",
-                "message": "An unexpected error occurred",
-            },
-        )
+        return INTERNAL_ERROR_RESPONSE
 
 
-def register_routers(app: FastAPI) -> None:
+def register_routers(app: FastAPI, is_development: bool) -> None:
     """
     Register API routers.
 
     Args:
         app: FastAPI application instance
+        is_development: Whether API docs are exposed
     """
     # Import and register module routers here
     try:
@@ -145,7 +150,7 @@ def register_routers(app: FastAPI) -> None:
         return {
             "message": f"Welcome to {settings.app.name}",
             "version": settings.app.version,
-            "docs": "/api/docs" if settings.is_development() else None,
+            "docs": "/api/docs" if is_development else None,
         }
 
     @app.get("/health", tags=["System"])
@@ -95,6 +95,7 @@ class SecuritySettings(BaseSettings):
     access_token_expires_minutes: int = Field(default=30, validation_alias="ACCESS_TOKEN_EXPIRES_MINUTES", description="Access token expiration in minutes")
     refresh_token_expires_days: int = Field(default=7, validation_alias="REFRESH_TOKEN_EXPIRES_DAYS", description="Refresh token expiration in days")
     password_reset_token_expires_hours: int = Field(default=1, validation_alias="PASSWORD_RESET_TOKEN_EXPIRES_HOURS", description="Password reset token expiration in hours")
+    bcrypt_rounds: int = Field(default=12, ge=4, le=31, validation_alias="BCRYPT_ROUNDS", description="bcrypt cost factor (log2 of hashing rounds)")
 
     @field_validator("secret_key")
     @classmethod
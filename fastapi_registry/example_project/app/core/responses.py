@@ -0,0 +1,33 @@
+"""Custom response classes."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response serialized with orjson.
+
+    Used for responses built from plain dicts (e.g. exception handlers, list
+    endpoints), where FastAPI does not serialize the content through Pydantic.
+    UTC datetimes are written with a "Z" suffix, matching Pydantic's output.
+    Content orjson cannot encode (e.g. integers beyond 64 bits echoed back in
+    validation errors) falls back to the standard library encoder.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """
+        Serialize content to JSON bytes.
+
+        Args:
+            content: Response content
+
+        Returns:
+            JSON-encoded content
+        """
+        try:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z)
+        except orjson.JSONEncodeError:
+            return super().render(content)
@@ -1,25 +1,113 @@
 """Authentication utilities for JWT token management and password hashing."""
 
-from datetime import UTC, datetime, timedelta
+import asyncio
+import base64
+import hashlib
+import hmac
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any
 
+import bcrypt
 import jwt
-from passlib.context import CryptContext
+import orjson
+from jwt import api_jws
+from jwt.types import Options
 
 from ...core.config import settings
+from .exceptions import ExpiredTokenError, InvalidTokenError
 from .types.jwt import CreateAccessTokenOptions, CreateRefreshTokenOptions, JWTPayload
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt cost factor for new hashes (configurable via BCRYPT_ROUNDS); existing hashes
+# embed their own cost, so raising it keeps them verifiable. Projects whose config predates
+# the setting get bcrypt's default cost.
+BCRYPT_ROUNDS: int = getattr(settings.security, "bcrypt_rounds", 12)
+
+# bcrypt only uses the first 72 bytes of a password
+BCRYPT_MAX_PASSWORD_BYTES = 72
+
+# Dedicated pool for bcrypt: one thread per core (bcrypt releases the GIL), kept
+# separate from the default executor so hashing bursts don't starve other to_thread work
+_password_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="bcrypt")
+
+# JWT signing settings, resolved once (tokens are decoded on every authenticated request)
+JWT_SECRET_KEY = settings.security.secret_key
+# Key as bytes, so neither the inline signer nor PyJWT re-encodes the secret per token
+JWT_SECRET_BYTES = JWT_SECRET_KEY.encode()
+JWT_ALGORITHM = settings.security.jwt_algorithm
+JWT_ALGORITHMS = [JWT_ALGORITHM]
+# HMAC algorithms are signed inline (see encode_jwt); anything else goes through PyJWT
+JWT_HMAC_DIGESTS = {"HS256": "sha256", "HS384": "sha384", "HS512": "sha512"}
+JWT_HMAC_DIGEST = JWT_HMAC_DIGESTS.get(JWT_ALGORITHM)
+# Claims every token issued by this module carries; tokens without them are rejected while decoding
+JWT_DECODE_OPTIONS: Options = {"require": ["exp", "sub", "type"]}
+
+# Token lifetimes in seconds; exp/iat are written as integer NumericDate claims
+ACCESS_TOKEN_TTL_SECONDS = settings.security.access_token_expires_minutes * 60
+REFRESH_TOKEN_TTL_SECONDS = settings.security.refresh_token_expires_days * 86400
+PASSWORD_RESET_TOKEN_TTL_SECONDS = settings.security.password_reset_token_expires_hours * 3600
+
+# Decoded token payloads, keyed by token digest: digest -> (cache expiry, payload)
+TOKEN_CACHE_TTL_SECONDS = 30
+TOKEN_CACHE_MAX_SIZE = 10_000
+_payload_cache: dict[bytes, tuple[float, JWTPayload]] = {}
+
+# Recently rejected tokens: digest -> (cache expiry, error raised), so repeats skip decoding
+INVALID_TOKEN_CACHE_TTL_SECONDS = 10
+INVALID_TOKEN_CACHE_MAX_SIZE = 4096
+_invalid_token_cache: dict[bytes, tuple[float, type[ExpiredTokenError | InvalidTokenError]]] = {}
+
+
+def _bcrypt_secret(password: str) -> bytes:
+    """Encode a password and cut it to what bcrypt uses, so oversized input costs no extra work."""
+    return password.encode()[:BCRYPT_MAX_PASSWORD_BYTES]
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)  # type: ignore[no-any-return]
+    return bcrypt.checkpw(_bcrypt_secret(plain_password), hashed_password.encode())
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password in the bcrypt thread pool, without blocking the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(_password_executor, verify_password, plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
     """Hash a password."""
-    return pwd_context.hash(password)  # type: ignore[no-any-return]
+    return bcrypt.hashpw(_bcrypt_secret(password), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password in the bcrypt thread pool, without blocking the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(_password_executor, get_password_hash, password)
+
+
+def _b64url(data: bytes) -> bytes:
+    """Base64url-encode without padding, as JWT segments require."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# Encoded JWT header segment (constant for a given algorithm), same bytes PyJWT would produce
+JWT_HEADER_SEGMENT = _b64url(orjson.dumps({"alg": JWT_ALGORITHM, "typ": "JWT"})) + b"."
+
+
+def encode_jwt(claims: dict[str, Any]) -> str:
+    """Sign JWT claims, serializing them with orjson instead of the stdlib json encoder.
+
+    For HMAC algorithms the token is assembled here from the precomputed header and a
+    single hmac.digest call, skipping PyJWT's per-call header and key handling.
+
+    Claims must already be JSON-native (timestamps as int), as produced by the token helpers below.
+    """
+    if JWT_HMAC_DIGEST is None:
+        return api_jws.encode(orjson.dumps(claims), JWT_SECRET_BYTES, algorithm=JWT_ALGORITHM)
+
+    signing_input = JWT_HEADER_SEGMENT + _b64url(orjson.dumps(claims))
+    signature = hmac.digest(JWT_SECRET_BYTES, signing_input, JWT_HMAC_DIGEST)
+    return (signing_input + b"." + _b64url(signature)).decode()
 
 
 def create_access_token(
@@ -35,11 +123,8 @@ def create_access_token(
     Returns:
         Encoded JWT token string
     """
-    now = datetime.now(UTC)
-    if expires_delta:
-        expire = now + expires_delta
-    else:
-        expire = now + timedelta(minutes=settings.security.access_token_expires_minutes)
+    now = int(time.time())
+    ttl = int(expires_delta.total_seconds()) if expires_delta else ACCESS_TOKEN_TTL_SECONDS
 
     payload: JWTPayload = {
         "sub": data["sub"],
@@ -47,29 +132,94 @@ def create_access_token(
         "tid": data.get("tid"),
         "trol": data.get("trol"),
         "type": "access",
-        "exp": int(expire.timestamp()),
-        "iat": int(now.timestamp()),
+        "exp": now + ttl,
+        "iat": now,
         "tfaPending": False,
         "tfaVerified": data.get("tfaVerified", False),
         "tfaMethod": data.get("tfaMethod"),
     }
-    encoded_jwt = jwt.encode(dict(payload), settings.security.secret_key, algorithm=settings.security.jwt_algorithm)
+    encoded_jwt = encode_jwt(dict(payload))
     return encoded_jwt
 
 
+class _ORJSONPyJWT(jwt.PyJWT):
+    """PyJWT decoder that parses the payload with orjson (signature and claim checks are unchanged)."""
+
+    def _decode_payload(self, decoded: dict[str, Any]) -> dict[str, Any]:
+        try:
+            payload = orjson.loads(decoded["payload"])
+        except orjson.JSONDecodeError as e:
+            raise jwt.DecodeError(f"Invalid payload string: {e}") from e
+        if not isinstance(payload, dict):
+            raise jwt.DecodeError("Invalid payload string: must be a json object")
+        return payload
+
+
+_jwt_decoder = _ORJSONPyJWT()
+
+
 def verify_token(token: str) -> JWTPayload:
     """Verify and decode a JWT token."""
-    from .exceptions import ExpiredTokenError, InvalidTokenError
-
     try:
-        payload = jwt.decode(token, settings.security.secret_key, algorithms=[settings.security.jwt_algorithm])
-        return payload  # type: ignore[no-any-return]
+        payload = _jwt_decoder.decode(token, JWT_SECRET_BYTES, algorithms=JWT_ALGORITHMS, options=JWT_DECODE_OPTIONS)
+        return payload  # type: ignore[return-value]
     except jwt.ExpiredSignatureError:
         raise ExpiredTokenError()
     except jwt.InvalidTokenError:
         raise InvalidTokenError()
 
 
+def verify_token_cached(token: str) -> JWTPayload:
+    """
+    Verify a JWT token, reusing the decoded payload of recently verified tokens.
+
+    Entries never outlive the token's own expiration, so expired tokens are
+    always re-verified (and rejected). The user is still loaded per request,
+    so deactivated or deleted users are rejected immediately. Rejected tokens
+    are remembered briefly, so a client retrying a bad token is turned away
+    without decoding it again.
+
+    Args:
+        token: Encoded JWT token
+
+    Returns:
+        Decoded token payload
+
+    Raises:
+        ExpiredTokenError: If token has expired
+        InvalidTokenError: If token is invalid
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    now = time.time()
+
+    cached = _payload_cache.get(key)
+    if cached is not None:
+        if cached[0] > now:
+            return cached[1]
+        del _payload_cache[key]
+
+    rejected = _invalid_token_cache.get(key)
+    if rejected is not None:
+        if rejected[0] > now:
+            raise rejected[1]()
+        del _invalid_token_cache[key]
+
+    try:
+        payload = verify_token(token)
+    except (ExpiredTokenError, InvalidTokenError) as e:
+        if len(_invalid_token_cache) >= INVALID_TOKEN_CACHE_MAX_SIZE:
+            del _invalid_token_cache[next(iter(_invalid_token_cache))]
+        _invalid_token_cache[key] = (now + INVALID_TOKEN_CACHE_TTL_SECONDS, type(e))
+        raise
+
+    if len(_payload_cache) >= TOKEN_CACHE_MAX_SIZE:
+        # Evict the oldest entry (dicts keep insertion order)
+        del _payload_cache[next(iter(_payload_cache))]
+    _payload_cache[key] = (min(now + TOKEN_CACHE_TTL_SECONDS, payload.get("exp", now)), payload)
+
+    return payload
+
+
 def create_refresh_token(data: CreateRefreshTokenOptions) -> str:
     """Create a JWT refresh token with longer expiration and 2FA context.
 
@@ -80,32 +230,39 @@ def create_refresh_token(data: CreateRefreshTokenOptions) -> str:
     Returns:
         Encoded JWT token string
     """
-    now = datetime.now(UTC)
-    expire = now + timedelta(days=settings.security.refresh_token_expires_days)
+    now = int(time.time())
 
     payload: JWTPayload = {
         "sub": data["sub"],
         "email": data.get("email"),
         "type": "refresh",
-        "exp": int(expire.timestamp()),
-        "iat": int(now.timestamp()),
+        "exp": now + REFRESH_TOKEN_TTL_SECONDS,
+        "iat": now,
         "tfaVerified": data.get("tfaVerified", False),
         "tfaMethod": data.get("tfaMethod"),
         # NOTE: tid/trol are NOT preserved in refresh token (security)
     }
-    encoded_jwt = jwt.encode(dict(payload), settings.security.secret_key, algorithm=settings.security.jwt_algorithm)
+    encoded_jwt = encode_jwt(dict(payload))
     return encoded_jwt
 
 
+def password_fingerprint(hashed_password: str) -> str:
+    """Short digest of a password hash, carried in reset tokens ("pwh" claim).
+
+    Reset tokens are not stored server-side; binding them to the current hash
+    makes each token stop working as soon as the password changes (single use).
+    """
+    return hashlib.sha256(hashed_password.encode()).hexdigest()[:16]
+
+
 def create_password_reset_token(data: dict[str, str]) -> str:
-    """Create a JWT password reset token with 1-hour expiration."""
-    now = datetime.now(UTC)
-    expire = now + timedelta(hours=settings.security.password_reset_token_expires_hours)
+    """Create a JWT password reset token (data carries sub and pwh, see password_fingerprint)."""
+    now = int(time.time())
     to_encode = {
         **data,
-        "exp": int(expire.timestamp()),
+        "exp": now + PASSWORD_RESET_TOKEN_TTL_SECONDS,
         "type": "password_reset",
-        "iat": int(now.timestamp()),
+        "iat": now,
     }
-    encoded_jwt = jwt.encode(to_encode, settings.security.secret_key, algorithm=settings.security.jwt_algorithm)
+    encoded_jwt = encode_jwt(to_encode)
     return encoded_jwt
@@ -10,9 +10,9 @@ Note: This module complements models.py which contains:
 For production use, replace UserStore with database operations using UserDB.
 """
 
-from datetime import UTC, datetime
+from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, String, Text
+from sqlalchemy import Boolean, DateTime, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
@@ -35,8 +35,6 @@ class UserDB(Base):
         is_active: Whether the user account is active
         is_admin: Whether the user has administrator privileges
         created_at: Account creation timestamp
-        reset_token: Password reset token (JWT)
-        reset_token_expiry: Password reset token expiration time
     """
 
     __tablename__ = "users"
@@ -48,9 +46,7 @@ class UserDB(Base):
     hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     is_admin: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(UTC), nullable=False)
-    reset_token: Mapped[str | None] = mapped_column(Text, nullable=True)
-    reset_token_expiry: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     deleted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True, default=None)
 
     def __repr__(self) -> str:
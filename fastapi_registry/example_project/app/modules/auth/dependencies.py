@@ -5,7 +5,7 @@ from typing import Annotated
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
-from .auth_utils import verify_token
+from .auth_utils import verify_token_cached
 from .exceptions import ExpiredTokenError, InactiveUserError, InvalidTokenError
 from .models import User
 from .repositories import get_user_repository
@@ -15,12 +15,16 @@ from .types.repository import UserRepositoryInterface
 # HTTP Bearer security scheme
 security = HTTPBearer()
 
+# Shared repository dependency: FastAPI caches it per request, so endpoints that
+# need both the current user and the auth service get one repository (and one session)
+UserRepositoryDep = Annotated[UserRepositoryInterface, Depends(get_user_repository)]
 
-def get_auth_service(user_repository: Annotated[UserRepositoryInterface, Depends(get_user_repository)]) -> AuthService:
+
+def get_auth_service(user_repository: UserRepositoryDep) -> AuthService:
     return AuthService(user_repository)
 
 
-async def get_current_user(credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)], user_repository: Annotated[UserRepositoryInterface, Depends(get_user_repository)]) -> User:
+async def get_current_user(credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)], user_repository: UserRepositoryDep) -> User:
     """
     Get current authenticated user from JWT token.
 
@@ -37,7 +41,7 @@ async def get_current_user(credentials: Annotated[HTTPAuthorizationCredentials,
     token = credentials.credentials
 
     try:
-        payload = verify_token(token)
+        payload = verify_token_cached(token)
 
         # Verify token type
         if payload.get("type") != "access":
@@ -6,30 +6,43 @@ or in-memory with DATABASE_URL="sqlite+aiosqlite:///:memory:"
 """
 
 import logging
-from datetime import UTC, datetime, timedelta
+import secrets
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
 
 try:
     from ulid import ULID
 
-    USE_ULID = True
+    def generate_user_id() -> str:
+        """Generate a new user ID (ULID)."""
+        return str(ULID())
+
 except ImportError:
     import uuid
 
-    USE_ULID = False
+    def generate_user_id() -> str:
+        """Generate a new user ID (UUID4 fallback when python-ulid is not installed)."""
+        return str(uuid.uuid4())
+
 
 from fastapi import Depends
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 
 from .auth_utils import (
     create_password_reset_token,
-    get_password_hash,
-    verify_password,
+    get_password_hash_async,
+    password_fingerprint,
+    verify_password_async,
+    verify_token,
 )
 from .db_models import UserDB
 from .exceptions import (
+    ExpiredTokenError,
+    InvalidTokenError,
     UserAlreadyExistsError,
 )
 from .models import User
@@ -38,6 +51,30 @@ from .types.repository import UserRepositoryInterface
 logger = logging.getLogger(__name__)
 
 
+def _user_from_db(user_db: UserDB) -> User:
+    """Build a User from a database row without re-validating it.
+
+    Rows were validated when written, so model_construct skips the Pydantic
+    validation pass (notably email validation), which runs on every
+    authenticated request via get_user_by_id.
+
+    Args:
+        user_db: Loaded UserDB row
+
+    Returns:
+        User model
+    """
+    return User.model_construct(
+        id=user_db.id,
+        email=user_db.email,
+        name=user_db.name,
+        hashedPassword=user_db.hashed_password,
+        isActive=user_db.is_active,
+        isAdmin=user_db.is_admin,
+        createdAt=user_db.created_at,
+    )
+
+
 class UserRepository(UserRepositoryInterface):
     """User repository for async database operations.
 
@@ -54,39 +91,31 @@ class UserRepository(UserRepositoryInterface):
         self.db = db
 
     async def create_user(self, email: str, password: str, full_name: str, is_admin: bool = False) -> User:
-        """Create a new user in database."""
-        # Normalize email to lowercase for case-insensitive storage
-        normalized_email = email.lower().strip()
-
-        # Check if user already exists
-        stmt = select(UserDB).where(UserDB.email == normalized_email)
-        result = await self.db.execute(stmt)
-        existing_user = result.scalar_one_or_none()
-
-        if existing_user:
-            raise UserAlreadyExistsError()
+        """Create a new user in database (email must already be normalized, see schemas.normalize_email)."""
+        # Generate new ID (ULID if available, otherwise UUID; chosen once at import)
+        user_id = generate_user_id()
 
-        # Generate new ID (ULID if available, otherwise UUID)
-        if USE_ULID:
-            user_id = str(ULID())
-        else:
-            user_id = str(uuid.uuid4())
+        # Hash off the event loop (bcrypt is CPU-bound)
+        hashed_password = await get_password_hash_async(password)
 
         # Create UserDB instance
-        user_db = UserDB(id=user_id, email=normalized_email, name=full_name, hashed_password=get_password_hash(password), is_active=True, is_admin=is_admin, created_at=datetime.now(UTC))
+        user_db = UserDB(id=user_id, email=email, name=full_name, hashed_password=hashed_password, is_active=True, is_admin=is_admin)
 
+        # The unique index on email is the existence check (no SELECT round trip beforehand)
         self.db.add(user_db)
-        await self.db.commit()
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            raise UserAlreadyExistsError() from None
         await self.db.refresh(user_db)
 
         # Convert to Pydantic User model for response
-        return User(id=user_db.id, email=user_db.email, name=user_db.name, hashedPassword=user_db.hashed_password, isActive=user_db.is_active, isAdmin=user_db.is_admin, createdAt=user_db.created_at)
+        return _user_from_db(user_db)
 
     async def get_user_by_email(self, email: str) -> User | None:
-        """Get user by email from database."""
-        normalized_email = email.lower().strip()
-
-        stmt = select(UserDB).where(UserDB.email == normalized_email)
+        """Get user by email from database (email must already be normalized, see schemas.normalize_email)."""
+        stmt = lambda_stmt(lambda: select(UserDB).where(UserDB.email == email))
         result = await self.db.execute(stmt)
         user_db = result.scalar_one_or_none()
 
@@ -94,142 +123,97 @@ class UserRepository(UserRepositoryInterface):
             return None
 
         # Convert to Pydantic User model
-        return User(
-            id=user_db.id,
-            email=user_db.email,
-            name=user_db.name,
-            hashedPassword=user_db.hashed_password,
-            isActive=user_db.is_active,
-            isAdmin=user_db.is_admin,
-            createdAt=user_db.created_at,
-            resetToken=user_db.reset_token,
-            resetTokenExpiry=user_db.reset_token_expiry,
-        )
+        return _user_from_db(user_db)
 
     async def get_user_by_id(self, user_id: str) -> User | None:
         """Get user by ID from database."""
-        stmt = select(UserDB).where(UserDB.id == user_id)
-        result = await self.db.execute(stmt)
-        user_db = result.scalar_one_or_none()
+        # Primary-key lookup: served from the session identity map when already loaded
+        user_db = await self.db.get(UserDB, user_id)
 
         if not user_db:
             return None
 
         # Convert to Pydantic User model
-        return User(
-            id=user_db.id,
-            email=user_db.email,
-            name=user_db.name,
-            hashedPassword=user_db.hashed_password,
-            isActive=user_db.is_active,
-            isAdmin=user_db.is_admin,
-            createdAt=user_db.created_at,
-            resetToken=user_db.reset_token,
-            resetTokenExpiry=user_db.reset_token_expiry,
-        )
+        return _user_from_db(user_db)
 
-    async def get_all_users(self) -> list[User]:
-        """Get all users from database."""
-        stmt = select(UserDB)
+    async def get_all_users(self, skip: int = 0, limit: int | None = None) -> list[User]:
+        """Get users from database, optionally paginated (ordered by ID)."""
+        stmt = select(UserDB).order_by(UserDB.id).offset(skip).limit(limit)
         result = await self.db.execute(stmt)
         users_db = result.scalars().all()
 
         # Convert to Pydantic User models
-        return [
-            User(
-                id=user_db.id,
-                email=user_db.email,
-                name=user_db.name,
-                hashedPassword=user_db.hashed_password,
-                isActive=user_db.is_active,
-                isAdmin=user_db.is_admin,
-                createdAt=user_db.created_at,
-                resetToken=user_db.reset_token,
-                resetTokenExpiry=user_db.reset_token_expiry,
-            )
-            for user_db in users_db
-        ]
+        return [_user_from_db(user_db) for user_db in users_db]
+
+    async def iter_users(self, batch_size: int = 500) -> AsyncIterator[User]:
+        """Stream all users from database (ordered by ID), fetching batch_size rows at a time."""
+        stmt = select(UserDB).order_by(UserDB.id).execution_options(yield_per=batch_size)
+        result = await self.db.stream_scalars(stmt)
+
+        async for user_db in result:
+            yield _user_from_db(user_db)
 
     async def update_user(self, user: User) -> User:
         """Update user in database."""
-        # Get existing user from database
-        stmt = select(UserDB).where(UserDB.id == user.id)
+        # Single UPDATE ... RETURNING round trip instead of SELECT + UPDATE + refresh.
+        # Only the ID is returned: the row now holds exactly the values written from user
+        # (returning the whole entity also breaks once the users module extends the table).
+        stmt = (
+            update(UserDB)
+            .where(UserDB.id == user.id)
+            .values(
+                email=user.email,
+                name=user.name,
+                hashed_password=user.hashedPassword,
+                is_active=user.isActive,
+                is_admin=user.isAdmin,
+            )
+            .returning(UserDB.id)
+        )
         result = await self.db.execute(stmt)
-        user_db = result.scalar_one_or_none()
 
-        if not user_db:
+        if result.scalar_one_or_none() is None:
             raise ValueError(f"User with id {user.id} not found")
 
-        # Update fields
-        user_db.email = user.email
-        user_db.name = user.name
-        user_db.hashed_password = user.hashedPassword
-        user_db.is_active = user.isActive
-        user_db.is_admin = user.isAdmin
-        user_db.reset_token = user.resetToken
-        user_db.reset_token_expiry = user.resetTokenExpiry
-
         await self.db.commit()
-        await self.db.refresh(user_db)
 
-        # Return updated user as Pydantic model
-        return User(
-            id=user_db.id,
-            email=user_db.email,
-            name=user_db.name,
-            hashedPassword=user_db.hashed_password,
-            isActive=user_db.is_active,
-            isAdmin=user_db.is_admin,
-            createdAt=user_db.created_at,
-            resetToken=user_db.reset_token,
-            resetTokenExpiry=user_db.reset_token_expiry,
-        )
+        return user
 
     async def generate_reset_token(self, email: str) -> str | None:
-        """Generate and store JWT password reset token for user."""
+        """Generate JWT password reset token for user (stateless, nothing is written)."""
         user = await self.get_user_by_email(email)
         if not user or not user.isActive:
             return None
 
-        # Generate JWT reset token
-        token = create_password_reset_token(data={"sub": user.id})
-
-        # Store token
-        user.set_reset_token(token, datetime.now(UTC) + timedelta(hours=1))
-        await self.update_user(user)
-
-        return token
+        # Bind the token to the current password hash, so it stops working once the password changes
+        return create_password_reset_token(data={"sub": user.id, "pwh": password_fingerprint(user.hashedPassword)})
 
     async def reset_password_with_token(self, token: str, new_password: str) -> bool:
         """Reset password using token."""
-        # Find user with this token
-        stmt = select(UserDB).where(UserDB.reset_token == token)
-        result = await self.db.execute(stmt)
-        user_db = result.scalar_one_or_none()
+        # Check signature, expiry and type first: forged or expired tokens never reach the database
+        try:
+            payload = verify_token(token)
+        except (ExpiredTokenError, InvalidTokenError):
+            return False
 
-        if not user_db:
+        if payload.get("type") != "password_reset":
             return False
 
-        # Convert to Pydantic model to use validation methods
-        user = User(
-            id=user_db.id,
-            email=user_db.email,
-            name=user_db.name,
-            hashedPassword=user_db.hashed_password,
-            isActive=user_db.is_active,
-            isAdmin=user_db.is_admin,
-            createdAt=user_db.created_at,
-            resetToken=user_db.reset_token,
-            resetTokenExpiry=user_db.reset_token_expiry,
-        )
+        # The token names its user; it is only valid for the password hash it was issued against
+        user_db = await self.db.get(UserDB, payload["sub"])
+        if not user_db or not secrets.compare_digest(str(payload.get("pwh", "")), password_fingerprint(user_db.hashed_password)):
+            return False
 
-        if user.is_reset_token_valid(token):
-            user.set_password(new_password)
-            user.clear_reset_token()
-            await self.update_user(user)
-            return True
+        current_hash = user_db.hashed_password
+        hashed_password = await get_password_hash_async(new_password)
 
-        return False
+        # Update only while the password is unchanged, so a token can be used once (even concurrently)
+        stmt = update(UserDB).where(UserDB.id == user_db.id, UserDB.hashed_password == current_hash).values(hashed_password=hashed_password).returning(UserDB.id)
+        result = await self.db.execute(stmt)
+        updated = result.scalar_one_or_none() is not None
+        await self.db.commit()
+
+        return updated
 
     async def change_password(self, user_id: str, current_password: str, new_password: str) -> bool:
         """Change user password after verifying current password."""
@@ -238,19 +222,17 @@ class UserRepository(UserRepositoryInterface):
             return False
 
         # Verify current password
-        if not verify_password(current_password, user.hashedPassword):
+        if not await verify_password_async(current_password, user.hashedPassword):
             return False
 
         # Update password
-        user.hashedPassword = get_password_hash(new_password)
+        user.hashedPassword = await get_password_hash_async(new_password)
         await self.update_user(user)
         return True
 
     async def delete_user(self, user_id: str, soft_delete: bool = True) -> bool:
         """Delete user account (soft delete by default)."""
-        stmt = select(UserDB).where(UserDB.id == user_id)
-        result = await self.db.execute(stmt)
-        user_db = result.scalar_one_or_none()
+        user_db = await self.db.get(UserDB, user_id)
 
         if not user_db:
             return False
@@ -262,9 +244,6 @@ class UserRepository(UserRepositoryInterface):
             # Anonymize email and name for GDPR compliance
             user_db.email = f"deleted_{user_db.id}@deleted.local"
             user_db.name = "Deleted User"
-            # Clear sensitive data
-            user_db.reset_token = None
-            user_db.reset_token_expiry = None
         else:
             # Hard delete: physically remove from database
             await self.db.delete(user_db)
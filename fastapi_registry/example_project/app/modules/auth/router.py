@@ -40,6 +40,12 @@ from .schemas import (
 # Create router
 router = APIRouter()
 
+# Constant responses, built once (MessageResponse is frozen, so sharing is safe)
+PASSWORD_RESET_REQUESTED = MessageResponse(message="If the email exists, a password reset link has been sent")
+PASSWORD_RESET_DONE = MessageResponse(message="Password has been reset successfully")
+PASSWORD_CHANGED = MessageResponse(message="Password changed successfully")
+ACCOUNT_DELETED = MessageResponse(message="Account has been deleted successfully")
+
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED, summary="Register new user", description="Create a new user account with email and password", tags=["Authentication"])
 @rate_limit("5/minute")  # Prevent registration abuse
@@ -55,7 +61,7 @@ async def register(user_data: UserRegister, auth_service: AuthServiceDep, reques
     """
     try:
         user = await auth_service.register_user(email=user_data.email, password=user_data.password, name=user_data.name)
-        return UserResponse(**user.to_response())
+        return UserResponse.from_user(user)
     except UserAlreadyExistsError:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="User with this email already exists")
 
@@ -116,7 +122,7 @@ async def forgot_password(request_data: ForgotPasswordRequest, auth_service: Aut
     """
     # Always return success message to prevent email enumeration
     await auth_service.request_password_reset(request_data.email)
-    return MessageResponse(message="If the email exists, a password reset link has been sent")
+    return PASSWORD_RESET_REQUESTED
 
 
 @router.post("/reset-password", response_model=MessageResponse, summary="Reset password", description="Reset password using reset token", tags=["Authentication"])
@@ -131,7 +137,7 @@ async def reset_password(request_data: ResetPasswordRequest, auth_service: AuthS
     """
     try:
         await auth_service.reset_password(request_data.token, request_data.newPassword)
-        return MessageResponse(message="Password has been reset successfully")
+        return PASSWORD_RESET_DONE
     except InvalidTokenError:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid or expired reset token")
 
@@ -151,7 +157,7 @@ async def change_password(request_data: ChangePasswordRequest, current_user: Cur
         # Get client IP address for security notification
         client_ip = request.client.host if request.client else None
         await auth_service.change_password(user_id=current_user.id, current_password=request_data.currentPassword, new_password=request_data.newPassword, ip_address=client_ip)
-        return MessageResponse(message="Password changed successfully")
+        return PASSWORD_CHANGED
     except InvalidCredentialsError:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Current password is incorrect")
     except UserNotFoundError:
@@ -167,7 +173,7 @@ async def get_current_user_info(current_user: CurrentUser) -> UserResponse:
     - ✅ Authentication required (JWT token via CurrentUser)
     - ⚪ Rate limiting: Not needed (read-only, already auth-protected)
     """
-    return UserResponse(**current_user.to_response())
+    return UserResponse.from_user(current_user)
 
 
 @router.delete("/account", response_model=MessageResponse, summary="Delete account", description="Delete current user's account (soft delete by default)", tags=["Authentication"])
@@ -185,7 +191,7 @@ async def delete_account(request_data: DeleteAccountRequest, current_user: Curre
     """
     try:
         await auth_service.delete_account(user_id=current_user.id, password=request_data.password, confirmation=request_data.confirmation, soft_delete=True)
-        return MessageResponse(message="Account has been deleted successfully")
+        return ACCOUNT_DELETED
     except InvalidCredentialsError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except UserNotFoundError:
@@ -2,9 +2,13 @@
 
 import re
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, EmailStr, Field, field_validator
 
+if TYPE_CHECKING:
+    from .models import User
+
 
 def validate_password_strength(password: str) -> str:
     """
@@ -36,6 +40,25 @@ def validate_password_strength(password: str) -> str:
     return password
 
 
+def normalize_email(email: str) -> str:
+    """
+    Normalize email for case-insensitive storage and lookup.
+
+    Request schemas apply this once at parse time, so repositories can use
+    the value as-is.
+
+    Args:
+        email: The email to normalize
+
+    Returns:
+        Lowercased email without surrounding whitespace
+    """
+    # strip() returns the same object when there is nothing to strip, so
+    # already-normalized input (the common case) is returned without copying
+    email = email.strip()
+    return email if email.islower() else email.lower()
+
+
 class UserLogin(BaseModel):
     """User login request schema with camelCase."""
 
@@ -43,6 +66,12 @@ class UserLogin(BaseModel):
     password: str = Field(..., min_length=8, max_length=100)
     recaptchaToken: str | None = Field(default=None, description="reCAPTCHA token (optional, only checked if RECAPTCHA_ENABLED=true)")
 
+    @field_validator("email")
+    @classmethod
+    def validate_email(cls, v: str) -> str:
+        """Normalize email to lowercase."""
+        return normalize_email(v)
+
 
 class UserRegister(BaseModel):
     """User registration request schema with camelCase."""
@@ -52,6 +81,12 @@ class UserRegister(BaseModel):
     name: str = Field(..., min_length=1, max_length=100)
     recaptchaToken: str | None = Field(default=None, description="reCAPTCHA token (optional, only checked if RECAPTCHA_ENABLED=true)")
 
+    @field_validator("email")
+    @classmethod
+    def validate_email(cls, v: str) -> str:
+        """Normalize email to lowercase."""
+        return normalize_email(v)
+
     @field_validator("password")
     @classmethod
     def validate_password(cls, v: str) -> str:
@@ -67,6 +102,8 @@ class TokenResponse(BaseModel):
     tokenType: str = "bearer"
     expiresIn: int  # seconds
 
+    model_config = {"frozen": True}
+
 
 class TokenRefresh(BaseModel):
     """Token refresh request schema."""
@@ -83,7 +120,12 @@ class UserResponse(BaseModel):
     isActive: bool
     createdAt: datetime
 
-    model_config = {"from_attributes": True, "populate_by_name": True}
+    model_config = {"from_attributes": True, "populate_by_name": True, "frozen": True}
+
+    @classmethod
+    def from_user(cls, user: "User") -> "UserResponse":
+        """Build a response from a User without re-validating its (already valid) fields."""
+        return cls.model_construct(id=user.id, email=user.email, name=user.name, isActive=user.isActive, createdAt=user.createdAt)
 
 
 class LoginResponse(BaseModel):
@@ -95,12 +137,16 @@ class LoginResponse(BaseModel):
     tokenType: str = "bearer"
     expiresIn: int
 
+    model_config = {"frozen": True}
+
 
 class MessageResponse(BaseModel):
-    """Generic message response."""
+    """Generic message response (immutable, so constant instances can be shared)."""
 
     message: str
 
+    model_config = {"frozen": True}
+
 
 class ForgotPasswordRequest(BaseModel):
     """Forgot password request schema."""
@@ -108,6 +154,12 @@ class ForgotPasswordRequest(BaseModel):
     email: EmailStr
     recaptchaToken: str | None = Field(default=None, description="reCAPTCHA token (optional, only checked if RECAPTCHA_ENABLED=true)")
 
+    @field_validator("email")
+    @classmethod
+    def validate_email(cls, v: str) -> str:
+        """Normalize email to lowercase."""
+        return normalize_email(v)
+
 
 class ResetPasswordRequest(BaseModel):
     """Reset password request schema."""
@@ -8,7 +8,8 @@ from ...core.email import get_email_service
 from .auth_utils import (
     create_access_token,
     create_refresh_token,
-    verify_token,
+    verify_password_async,
+    verify_token_cached,
 )
 from .exceptions import (
     InvalidCredentialsError,
@@ -55,7 +56,7 @@ class AuthService:
                 await email_service.send_welcome_email(to=email, name=name)
             except Exception as e:
                 # Log error but don't fail registration if email fails
-                logger.warning(f"Failed to send welcome email: {e}")
+                logger.warning("Failed to send welcome email: %s", e)
 
             return user
         except UserAlreadyExistsError:
@@ -81,7 +82,7 @@ class AuthService:
             raise InvalidCredentialsError("Invalid email or password")
 
         # Verify password
-        if not user.verify_password(password):
+        if not await verify_password_async(password, user.hashedPassword):
             raise InvalidCredentialsError("Invalid email or password")
 
         # Check if user is active
@@ -106,7 +107,7 @@ class AuthService:
             }
         )
 
-        return LoginResponse(user=UserResponse(**user.to_response()), accessToken=access_token, refreshToken=refresh_token, tokenType="bearer", expiresIn=settings.security.access_token_expires_minutes * 60)  # Convert to seconds
+        return LoginResponse(user=UserResponse.from_user(user), accessToken=access_token, refreshToken=refresh_token, tokenType="bearer", expiresIn=settings.security.access_token_expires_minutes * 60)  # Convert to seconds
 
     async def refresh_access_token(self, refresh_token: str) -> dict[str, str | int]:
         """
@@ -122,7 +123,7 @@ class AuthService:
             InvalidTokenError: If refresh token is invalid
         """
         try:
-            payload = verify_token(refresh_token)
+            payload = verify_token_cached(refresh_token)
 
             # Verify token type
             if payload.get("type") != "refresh":
@@ -168,7 +169,7 @@ class AuthService:
             raise
         except Exception as e:
             # Log unexpected errors for debugging
-            logger.error(f"Unexpected error during token refresh: {e}", exc_info=True)
+            logger.error("Unexpected error during token refresh: %s", e, exc_info=True)
             raise InvalidTokenError("Invalid or expired refresh token")
 
     async def request_password_reset(self, email: str) -> bool:
@@ -197,15 +198,15 @@ class AuthService:
                 email_service = get_email_service()
                 await email_service.send_password_reset_email(to=email, name=user.name, reset_token=token)
             except Exception as e:
-                logger.error(f"Failed to send password reset email: {e}")
+                logger.error("Failed to send password reset email: %s", e)
 
             # In development mode only, also log the token (NEVER in production!)
             environment = os.getenv("ENVIRONMENT", "production").lower()
             if environment == "development":
-                logger.warning(f"DEV MODE: Password reset token for {email}: {token}\n" f"Reset link: /reset-password?token={token}")
+                logger.warning("DEV MODE: Password reset token for %s: %s\nReset link: /reset-password?token=%s", email, token, token)
             else:
                 # In production, just log that email was sent without exposing token
-                logger.info(f"Password reset email sent to {email}")
+                logger.info("Password reset email sent to %s", email)
             return True
         return False
 
@@ -258,7 +259,7 @@ class AuthService:
             await email_service.send_password_changed_email(to=user.email, name=user.name, ip_address=ip_address)
         except Exception as e:
             # Log error but don't fail password change if email fails
-            logger.warning(f"Failed to send password changed email: {e}")
+            logger.warning("Failed to send password changed email: %s", e)
 
         return True
 
@@ -286,7 +287,7 @@ class AuthService:
 
         # Verify password if provided
         if password:
-            if not user.verify_password(password):
+            if not await verify_password_async(password, user.hashedPassword):
                 raise InvalidCredentialsError("Password is incorrect")
 
         # Verify confirmation phrase (should be 'DELETE' or user email)
@@ -308,7 +309,7 @@ class AuthService:
             await email_service.send_account_deleted_email(to=user_email, name=user_name)
         except Exception as e:
             # Log error but don't fail deletion if email fails
-            logger.warning(f"Failed to send account deletion email: {e}")
+            logger.warning("Failed to send account deletion email: %s", e)
 
         # TODO: Invalidate all user sessions/tokens
         # TODO: Delete related data (2FA, passkeys, etc.)
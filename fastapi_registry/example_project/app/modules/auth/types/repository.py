@@ -5,6 +5,7 @@ repositories must implement. This allows easy switching between implementations.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
 from ..models import User
 
@@ -59,11 +60,27 @@ class UserRepositoryInterface(ABC):
         ...
 
     @abstractmethod
-    async def get_all_users(self) -> list[User]:
-        """Get all users.
+    async def get_all_users(self, skip: int = 0, limit: int | None = None) -> list[User]:
+        """Get all users, optionally paginated.
+
+        Args:
+            skip: Number of users to skip
+            limit: Maximum number of users to return (None for no limit)
 
         Returns:
-            List of all user objects
+            List of user objects
+        """
+        ...
+
+    @abstractmethod
+    def iter_users(self, batch_size: int = 500) -> AsyncIterator[User]:
+        """Stream all users without loading them into memory at once.
+
+        Args:
+            batch_size: Number of rows fetched per round trip
+
+        Yields:
+            User objects
         """
         ...
 
@@ -81,7 +98,7 @@ class UserRepositoryInterface(ABC):
 
     @abstractmethod
     async def generate_reset_token(self, email: str) -> str | None:
-        """Generate and store JWT password reset token for user.
+        """Generate a JWT password reset token for user (nothing is stored).
 
         Args:
             email: User email address
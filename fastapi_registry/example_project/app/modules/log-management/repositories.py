@@ -11,11 +11,21 @@ try:
     from ulid import ULID
 
     USE_ULID = True
+
+    def generate_log_id() -> str:
+        """Generate a new log ID (ULID)."""
+        return str(ULID())
+
 except ImportError:
     import uuid
 
     USE_ULID = False
 
+    def generate_log_id() -> str:
+        """Generate a new log ID (UUID4 fallback when python-ulid is not installed)."""
+        return str(uuid.uuid4())
+
+
 from fastapi import Depends
 from sqlalchemy import and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -51,11 +61,8 @@ class LogRepository(SearchMixin):
 
     async def create_log(self, level: LogLevel, message: str, module: str | None = None, function: str | None = None, user_id: str | None = None, request_id: str | None = None, traceback: str | None = None, extra_data: str | None = None) -> Log:
         """Create a new log entry in database."""
-        # Generate new ID (ULID if available, otherwise UUID)
-        if USE_ULID:
-            log_id = str(ULID())
-        else:
-            log_id = str(uuid.uuid4())
+        # Generate new ID (ULID if available, otherwise UUID; chosen once at import)
+        log_id = generate_log_id()
 
         # Create LogDB instance
         log_db = LogDB(id=log_id, level=level.value, message=message, module=module, function=function, user_id=user_id, request_id=request_id, traceback=traceback, extra_data=extra_data, created_at=datetime.now(UTC))
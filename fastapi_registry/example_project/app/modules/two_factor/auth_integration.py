@@ -46,7 +46,7 @@ class AuthServiceWith2FA(AuthService):
         If user has 2FA enabled, returns TwoFactorRequiredResponse instead of tokens.
         Otherwise, returns normal LoginResponse with tokens.
         """
-        from app.modules.auth.auth_utils import verify_password
+        from app.modules.auth.auth_utils import verify_password_async
         from app.modules.auth.exceptions import InvalidCredentialsError
 
         # Get user by email
@@ -55,7 +55,7 @@ class AuthServiceWith2FA(AuthService):
             raise InvalidCredentialsError("Invalid email or password")
 
         # Verify password
-        if not verify_password(password, user.hashedPassword):
+        if not await verify_password_async(password, user.hashedPassword):
             raise InvalidCredentialsError("Invalid email or password")
 
         # Check if user is active
@@ -119,7 +119,7 @@ class AuthServiceWith2FA(AuthService):
         )
 
         return LoginResponse(
-            user=UserResponse(**user.to_response()),
+            user=UserResponse.from_user(user),
             accessToken=access_token,
             refreshToken=refresh_token,
             tokenType="bearer",
@@ -34,7 +34,7 @@ class TotpStatusResponse(BaseModel):
 
 
 class RegenerateBackupCodesRequest(BaseModel):
-    password: str | None = None
+    password: str | None = Field(default=None, max_length=100)
     totpCode: str | None = None
 
 
@@ -45,7 +45,7 @@ class BackupCodesResponse(BaseModel):
 
 
 class DisableTotpRequest(BaseModel):
-    password: str | None = None
+    password: str | None = Field(default=None, max_length=100)
     backupCode: str | None = None
 
 
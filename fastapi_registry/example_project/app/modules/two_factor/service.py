@@ -154,7 +154,7 @@ class TwoFactorService:
         user_repository=None,
     ) -> dict[str, Any]:
         """Regenerate backup codes. Requires password or current TOTP code."""
-        from app.modules.auth.auth_utils import verify_password
+        from app.modules.auth.auth_utils import verify_password_async
 
         config = await self.repository.get_totp_config(user_id)
         if not config or not config.is_enabled:
@@ -165,7 +165,7 @@ class TwoFactorService:
             if not user_repository:
                 raise ValueError("User repository required for password verification")
             user = await user_repository.get_user_by_id(user_id)
-            if not user or not verify_password(password, user.hashedPassword):
+            if not user or not await verify_password_async(password, user.hashedPassword):
                 raise InvalidTwoFactorCodeError("Invalid password")
         elif totp_code:
             secret = decrypt_secret(config.secret)
@@ -192,7 +192,7 @@ class TwoFactorService:
         user_repository=None,
     ) -> dict[str, Any]:
         """Disable TOTP. Requires password or backup code."""
-        from app.modules.auth.auth_utils import verify_password
+        from app.modules.auth.auth_utils import verify_password_async
 
         config = await self.repository.get_totp_config(user_id)
         if not config:
@@ -203,7 +203,7 @@ class TwoFactorService:
             if not user_repository:
                 raise ValueError("User repository required for password verification")
             user = await user_repository.get_user_by_id(user_id)
-            if not user or not verify_password(password, user.hashedPassword):
+            if not user or not await verify_password_async(password, user.hashedPassword):
                 raise InvalidTwoFactorCodeError("Invalid password")
         elif backup_code:
             backup_codes = json.loads(config.backup_codes) if config.backup_codes else []
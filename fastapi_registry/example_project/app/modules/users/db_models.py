@@ -10,7 +10,7 @@ extend it with additional fields like 'role' if needed.
 
 from datetime import UTC, datetime
 
-from sqlalchemy import Boolean, DateTime, String
+from sqlalchemy import Boolean, DateTime, Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
@@ -27,23 +27,29 @@ class UserDB(Base):
 
     Attributes:
         id: Unique identifier (ULID format, 36 chars)
-        email: User email address (unique, indexed)
+        email: User email address (unique index defined by the auth module)
         name: User full name
         role: User role (user, admin, etc.)
-        is_active: Whether the user account is active
+        is_active: Whether the user account is active (indexed with id for paginated listings)
         created_at: Account creation timestamp
         updated_at: Last update timestamp
     """
 
     __tablename__ = "users"
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        # Active-user listings filter on is_active and page in id order straight off this index
+        Index("ix_users_is_active_id", "is_active", "id"),
+        {"extend_existing": True},
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)  # ULID
-    email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
+    # The unique ix_users_email index comes from the auth module's UserDB, which this
+    # module depends on; redeclaring it here would make create_all emit it twice
+    email: Mapped[str] = mapped_column(String(255), nullable=False)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     role: Mapped[str] = mapped_column(String(50), default="user", nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(UTC), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(UTC), onupdate=lambda: datetime.now(UTC), nullable=False)
 
     def __repr__(self) -> str:
@@ -37,14 +37,14 @@ Production (PostgreSQL):
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel
 
 
 class User(BaseModel):
     """User model with camelCase fields for API responses."""
 
     id: str  # ULID or UUID as string
-    email: EmailStr
+    email: str  # Validated (EmailStr) by the request schemas
     name: str
     role: str = "user"  # user, admin, etc.
     isActive: bool = True
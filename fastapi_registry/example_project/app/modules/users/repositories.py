@@ -11,14 +11,21 @@ from datetime import UTC, datetime
 try:
     from ulid import ULID
 
-    USE_ULID = True
+    def generate_user_id() -> str:
+        """Generate a new user ID (ULID)."""
+        return str(ULID())
+
 except ImportError:
     import uuid
 
-    USE_ULID = False
+    def generate_user_id() -> str:
+        """Generate a new user ID (UUID4 fallback when python-ulid is not installed)."""
+        return str(uuid.uuid4())
+
 
 from fastapi import Depends
 from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.common.search import SearchMixin
@@ -31,6 +38,27 @@ from .models import User
 logger = logging.getLogger(__name__)
 
 
+# Deliberately mirrors auth.schemas.normalize_email: modules are installed independently,
+# so the users module cannot import from auth (or rely on a shared copy in app/common)
+def _normalize_email(email: str) -> str:
+    """Lowercase and strip an email, returning already-normalized input without copying."""
+    email = email.strip()
+    return email if email.islower() else email.lower()
+
+
+def _user_from_db(user_db: UserDB) -> User:
+    """Build a User from a database row without re-validating it (rows were validated when written)."""
+    return User.model_construct(
+        id=user_db.id,
+        email=user_db.email,
+        name=user_db.name,
+        role=user_db.role,
+        isActive=user_db.is_active,
+        createdAt=user_db.created_at,
+        updatedAt=user_db.updated_at,
+    )
+
+
 class UserRepository(SearchMixin):
     """User repository for async database operations.
 
@@ -54,37 +82,31 @@ class UserRepository(SearchMixin):
     async def create_user(self, email: str, name: str, role: str = "user") -> User:
         """Create a new user in database."""
         # Normalize email to lowercase for case-insensitive storage
-        normalized_email = email.lower().strip()
-
-        # Check if user already exists
-        stmt = select(UserDB).where(UserDB.email == normalized_email)
-        result = await self.db.execute(stmt)
-        existing_user = result.scalar_one_or_none()
-
-        if existing_user:
-            raise UserAlreadyExistsError(f"User with email {email} already exists")
+        normalized_email = _normalize_email(email)
 
-        # Generate new ID (ULID if available, otherwise UUID)
-        if USE_ULID:
-            user_id = str(ULID())
-        else:
-            user_id = str(uuid.uuid4())
+        # Generate new ID (ULID if available, otherwise UUID; chosen once at import)
+        user_id = generate_user_id()
 
         now = datetime.now(UTC)
 
         # Create UserDB instance
         user_db = UserDB(id=user_id, email=normalized_email, name=name, role=role, is_active=True, created_at=now, updated_at=now)
 
+        # The unique index on email is the existence check (no SELECT round trip beforehand)
         self.db.add(user_db)
-        await self.db.commit()
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            raise UserAlreadyExistsError(f"User with email {email} already exists") from None
         await self.db.refresh(user_db)
 
         # Convert to Pydantic User model for response
-        return User(id=user_db.id, email=user_db.email, name=user_db.name, role=user_db.role, isActive=user_db.is_active, createdAt=user_db.created_at, updatedAt=user_db.updated_at)
+        return _user_from_db(user_db)
 
     async def get_user_by_email(self, email: str) -> User | None:
         """Get user by email from database."""
-        normalized_email = email.lower().strip()
+        normalized_email = _normalize_email(email)
 
         stmt = select(UserDB).where(UserDB.email == normalized_email)
         result = await self.db.execute(stmt)
@@ -94,21 +116,20 @@ class UserRepository(SearchMixin):
             return None
 
         # Convert to Pydantic User model
-        return User(id=user_db.id, email=user_db.email, name=user_db.name, role=user_db.role, isActive=user_db.is_active, createdAt=user_db.created_at, updatedAt=user_db.updated_at)
+        return _user_from_db(user_db)
 
     async def get_user_by_id(self, user_id: str) -> User | None:
         """Get user by ID from database."""
-        stmt = select(UserDB).where(UserDB.id == user_id)
-        result = await self.db.execute(stmt)
-        user_db = result.scalar_one_or_none()
+        # Primary-key lookup: served from the session identity map when already loaded
+        user_db = await self.db.get(UserDB, user_id)
 
         if not user_db:
             return None
 
         # Convert to Pydantic User model
-        return User(id=user_db.id, email=user_db.email, name=user_db.name, role=user_db.role, isActive=user_db.is_active, createdAt=user_db.created_at, updatedAt=user_db.updated_at)
+        return _user_from_db(user_db)
 
-    async def get_all_users(self, skip: int = 0, limit: int = 100, include_inactive: bool = False, search: str | None = None) -> list[User]:
+    async def get_all_users(self, skip: int = 0, limit: int = 100, include_inactive: bool = False, search: str | None = None, after_id: str | None = None) -> list[User]:
         """Get all users from database with pagination and search.
 
         Args:
@@ -116,6 +137,8 @@ class UserRepository(SearchMixin):
             limit: Maximum records to return
             include_inactive: Include inactive users
             search: Search term (searches in name, email, role)
+            after_id: Keyset cursor: only return users with a greater ID (the last ID
+                of the previous page). Unlike skip, the database seeks straight to it.
 
         Returns:
             List of users matching criteria
@@ -125,17 +148,21 @@ class UserRepository(SearchMixin):
         if not include_inactive:
             stmt = stmt.where(UserDB.is_active == True)  # noqa: E712
 
+        if after_id is not None:
+            stmt = stmt.where(UserDB.id > after_id)
+
         # Apply search filter
         if search:
             stmt = self.apply_search(stmt, search)
 
-        stmt = stmt.offset(skip).limit(limit)
+        # Stable id order, so pages don't overlap or skip rows
+        stmt = stmt.order_by(UserDB.id).offset(skip).limit(limit)
 
         result = await self.db.execute(stmt)
         users_db = result.scalars().all()
 
         # Convert to Pydantic User models
-        return [User(id=user_db.id, email=user_db.email, name=user_db.name, role=user_db.role, isActive=user_db.is_active, createdAt=user_db.created_at, updatedAt=user_db.updated_at) for user_db in users_db]
+        return [_user_from_db(user_db) for user_db in users_db]
 
     async def update_user(
         self,
@@ -146,17 +173,15 @@ class UserRepository(SearchMixin):
         is_active: bool | None = None,
     ) -> User | None:
         """Update user fields in database."""
-        # Get existing user from database
-        stmt = select(UserDB).where(UserDB.id == user_id)
-        result = await self.db.execute(stmt)
-        user_db = result.scalar_one_or_none()
+        # Get existing user from database (primary-key lookup, no SELECT statement to build)
+        user_db = await self.db.get(UserDB, user_id)
 
         if not user_db:
             return None
 
         # Handle email update
         if email is not None:
-            normalized_email = email.lower().strip()
+            normalized_email = _normalize_email(email)
             if normalized_email != user_db.email:
                 # Check if new email is already taken
                 email_stmt = select(UserDB).where(UserDB.email == normalized_email)
@@ -180,13 +205,11 @@ class UserRepository(SearchMixin):
         await self.db.refresh(user_db)
 
         # Return updated user as Pydantic model
-        return User(id=user_db.id, email=user_db.email, name=user_db.name, role=user_db.role, isActive=user_db.is_active, createdAt=user_db.created_at, updatedAt=user_db.updated_at)
+        return _user_from_db(user_db)
 
     async def delete_user(self, user_id: str) -> bool:
         """Delete user (soft delete - set is_active to False)."""
-        stmt = select(UserDB).where(UserDB.id == user_id)
-        result = await self.db.execute(stmt)
-        user_db = result.scalar_one_or_none()
+        user_db = await self.db.get(UserDB, user_id)
 
         if not user_db:
             return False
@@ -199,9 +222,7 @@ class UserRepository(SearchMixin):
 
     async def hard_delete_user(self, user_id: str) -> bool:
         """Permanently delete user from database."""
-        stmt = select(UserDB).where(UserDB.id == user_id)
-        result = await self.db.execute(stmt)
-        user_db = result.scalar_one_or_none()
+        user_db = await self.db.get(UserDB, user_id)
 
         if not user_db:
             return False
@@ -1,8 +1,9 @@
 """FastAPI router for user management endpoints."""
 
-from typing import Annotated
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
 from .dependencies import AdminUser, CurrentUser
 from .exceptions import UserAlreadyExistsError
@@ -15,10 +16,23 @@ from .schemas import (
     UserUpdate,
 )
 
-# Create router
+# Create router.
+# User endpoints return responses serialized from User.to_response() with orjson: repository
+# users are already valid, so FastAPI's response validation against response_model (still
+# declared, for the OpenAPI schema) is skipped.
 router = APIRouter()
 
 
+def _json_response(content: Any, status_code: int = status.HTTP_200_OK) -> Response:
+    """Serialize content with orjson (UTC datetimes get a "Z" suffix, as Pydantic writes them)."""
+    return Response(orjson.dumps(content, option=orjson.OPT_UTC_Z), status_code=status_code, media_type="application/json")
+
+
+def _user_not_found(user_id: str) -> HTTPException:
+    """Build the 404 raised when a user ID does not exist."""
+    return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"User {user_id} not found")
+
+
 @router.post(
     "/",
     response_model=UserResponse,
@@ -26,11 +40,11 @@ router = APIRouter()
     summary="Create new user",
     description="Create a new user (admin only)",
 )
-async def create_user(user_data: UserCreate, _: AdminUser, repo: Annotated[UserRepository, Depends(get_user_repository)]) -> UserResponse:
+async def create_user(user_data: UserCreate, _: AdminUser, repo: Annotated[UserRepository, Depends(get_user_repository)]) -> Response:
     """Create a new user."""
     try:
         user = await repo.create_user(email=user_data.email, name=user_data.name, role=user_data.role)
-        return UserResponse(**user.to_response())
+        return _json_response(user.to_response(), status_code=status.HTTP_201_CREATED)
     except UserAlreadyExistsError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
 
@@ -48,21 +62,23 @@ async def list_users(
     limit: int = Query(default=100, ge=1, le=1000, description="Max records to return"),
     include_inactive: bool = Query(default=False, description="Include inactive users"),
     search: str | None = Query(default=None, description="Search in name, email, and role"),
-) -> UserListResponse:
+    after: str | None = Query(default=None, description="Return users after this ID (last ID of the previous page); faster than skip for deep pages"),
+) -> Response:
     """Get list of users with optional search.
 
     Search is performed across name, email, and role fields.
     Example: ?search=john will find users with 'john' in name, email, or role.
     """
-    users = await repo.get_all_users(skip=skip, limit=limit, include_inactive=include_inactive, search=search)
-    total = await repo.count_users(include_inactive=include_inactive, search=search)
+    users = await repo.get_all_users(skip=skip, limit=limit, include_inactive=include_inactive, search=search, after_id=after)
+
+    # A partial page is the last page, so the total follows without a COUNT query
+    # (unless it is empty past the first page, where skip may overshoot the total)
+    if after is None and len(users) < limit and (users or skip == 0):
+        total = skip + len(users)
+    else:
+        total = await repo.count_users(include_inactive=include_inactive, search=search)
 
-    return UserListResponse(
-        users=[UserResponse(**u.to_response()) for u in users],
-        total=total,
-        skip=skip,
-        limit=limit,
-    )
+    return _json_response({"users": [u.to_response() for u in users], "total": total, "skip": skip, "limit": limit})
 
 
 @router.get(
@@ -73,6 +89,8 @@ async def list_users(
 )
 async def get_current_user_info(current_user: CurrentUser) -> UserResponse:
     """Get current user information."""
+    # Validated through UserResponse: the user comes from whichever get_current_user
+    # the project wires in, so its shape is not guaranteed to match the schema
     return UserResponse(**current_user.to_response())
 
 
@@ -82,12 +100,12 @@ async def get_current_user_info(current_user: CurrentUser) -> UserResponse:
     summary="Get user by ID",
     description="Get a specific user by their ID",
 )
-async def get_user(user_id: str, _: AdminUser, repo: Annotated[UserRepository, Depends(get_user_repository)]) -> UserResponse:
+async def get_user(user_id: str, _: AdminUser, repo: Annotated[UserRepository, Depends(get_user_repository)]) -> Response:
     """Get user by ID."""
     user = await repo.get_user_by_id(user_id)
     if not user:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"User {user_id} not found")
-    return UserResponse(**user.to_response())
+        raise _user_not_found(user_id)
+    return _json_response(user.to_response())
 
 
 @router.patch(
@@ -96,7 +114,7 @@ async def get_user(user_id: str, _: AdminUser, repo: Annotated[UserRepository, D
     summary="Update user",
     description="Update user information (admin only)",
 )
-async def update_user(user_id: str, user_data: UserUpdate, _: AdminUser, repo: Annotated[UserRepository, Depends(get_user_repository)]) -> UserResponse:
+async def update_user(user_id: str, user_data: UserUpdate, _: AdminUser, repo: Annotated[UserRepository, Depends(get_user_repository)]) -> Response:
     """Update user information."""
     try:
         user = await repo.update_user(
@@ -107,11 +125,8 @@ async def update_user(user_id: str, user_data: UserUpdate, _: AdminUser, repo: A
             is_active=user_data.isActive,
         )
         if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"User {user_id} not found",
-            )
-        return UserResponse(**user.to_response())
+            raise _user_not_found(user_id)
+        return _json_response(user.to_response())
     except UserAlreadyExistsError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
 
@@ -126,7 +141,7 @@ async def delete_user(user_id: str, _: AdminUser, repo: Annotated[UserRepository
     """Soft delete user."""
     success = await repo.delete_user(user_id)
     if not success:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"User {user_id} not found")
+        raise _user_not_found(user_id)
     return MessageResponse(message=f"User {user_id} deactivated successfully")
 
 
@@ -140,5 +155,5 @@ async def hard_delete_user(user_id: str, _: AdminUser, repo: Annotated[UserRepos
     """Permanently delete user."""
     success = await repo.hard_delete_user(user_id)
     if not success:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"User {user_id} not found")
+        raise _user_not_found(user_id)
     return MessageResponse(message=f"User {user_id} permanently deleted")
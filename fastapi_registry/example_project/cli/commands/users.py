@@ -221,6 +221,7 @@ async def _create_user_in_db(email: str, name: str, password: str, is_admin: boo
     """
     from app.core.database import get_db
     from app.modules.auth.repositories import UserRepository
+    from app.modules.auth.schemas import normalize_email
 
     # Get database session
     async for db in get_db():
@@ -228,7 +229,7 @@ async def _create_user_in_db(email: str, name: str, password: str, is_admin: boo
 
         try:
             # Create user
-            user = await repo.create_user(email=email, password=password, full_name=name, is_admin=is_admin)
+            user = await repo.create_user(email=normalize_email(email), password=password, full_name=name, is_admin=is_admin)
 
             # Convert to dict for display
             return {
@@ -355,9 +356,8 @@ async def _get_users_from_db() -> list[dict[str, Any]]:
 
     async for db in get_db():
         repo = UserRepository(db)
-        users = await repo.get_all_users()
 
-        # Convert to dict for display
+        # Stream users and convert to dict for display
         return [
             {
                 "id": user.id,
@@ -367,7 +367,7 @@ async def _get_users_from_db() -> list[dict[str, Any]]:
                 "isAdmin": user.isAdmin,
                 "createdAt": user.createdAt,
             }
-            for user in users
+            async for user in repo.iter_users()
         ]
 
     return []
@@ -454,13 +454,14 @@ async def _find_user(identifier: str) -> dict[str, Any] | None:
     """
     from app.core.database import get_db
     from app.modules.auth.repositories import UserRepository
+    from app.modules.auth.schemas import normalize_email
 
     async for db in get_db():
         repo = UserRepository(db)
 
         # Try to find by email first
         if "@" in identifier:
-            user = await repo.get_user_by_email(identifier)
+            user = await repo.get_user_by_email(normalize_email(identifier))
         else:
             # Try to find by ID
             user = await repo.get_user_by_id(identifier)
@@ -1,8 +1,10 @@
 """Pytest configuration and fixtures."""
 
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -46,3 +48,17 @@ def client(db_session):
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
+
+
+@pytest_asyncio.fixture(scope="function")
+async def async_session_factory():
+    """Create a fresh async in-memory database for each test.
+
+    Yields a session factory rather than a session, so tests can open one
+    session per simulated request, as the app does.
+    """
+    async_engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+    await async_engine.dispose()
@@ -0,0 +1,153 @@
+"""Tests for the auth user repository."""
+
+import pytest
+
+# Needs the auth and users modules, which projects created by `init` start without
+pytest.importorskip("app.modules.auth")
+pytest.importorskip("app.modules.users")
+
+from app.modules.auth import auth_utils  # noqa: E402
+from app.modules.auth.auth_utils import create_access_token, create_password_reset_token, password_fingerprint, verify_token  # noqa: E402
+from app.modules.auth.repositories import UserRepository  # noqa: E402
+from app.modules.users.repositories import UserRepository as UsersModuleRepository  # noqa: E402
+
+PASSWORD = "Secret123!"
+
+
+@pytest.fixture(autouse=True)
+def fast_password_hashing(monkeypatch):
+    """Hash passwords at bcrypt's minimum cost, so tests creating users stay fast."""
+    monkeypatch.setattr(auth_utils, "BCRYPT_ROUNDS", 4)
+
+
+async def _create_user(async_session_factory, email: str = "user@example.com"):
+    """Register a user through the auth repository in its own session."""
+    async with async_session_factory() as db:
+        return await UserRepository(db).create_user(email=email, password=PASSWORD, full_name="Test User")
+
+
+@pytest.mark.asyncio
+async def test_soft_delete_by_users_module_is_seen_by_auth(async_session_factory):
+    """Test that a user deactivated through the users module is loaded as inactive."""
+    user = await _create_user(async_session_factory)
+
+    async with async_session_factory() as db:
+        assert await UsersModuleRepository(db).delete_user(user.id) is True
+
+    async with async_session_factory() as db:
+        repo = UserRepository(db)
+        by_id = await repo.get_user_by_id(user.id)
+        by_email = await repo.get_user_by_email(user.email)
+
+    assert by_id is not None and by_id.isActive is False
+    assert by_email is not None and by_email.isActive is False
+
+
+@pytest.mark.asyncio
+async def test_email_can_register_again_after_hard_delete(async_session_factory):
+    """Test that a hard-deleted user's email is free to register again."""
+    user = await _create_user(async_session_factory)
+
+    async with async_session_factory() as db:
+        assert await UsersModuleRepository(db).hard_delete_user(user.id) is True
+
+    new_user = await _create_user(async_session_factory)
+
+    assert new_user.id != user.id
+    async with async_session_factory() as db:
+        assert await UserRepository(db).get_user_by_id(user.id) is None
+
+
+@pytest.mark.asyncio
+async def test_password_change_is_seen_by_next_lookup(async_session_factory):
+    """Test that a changed password hash is loaded on the next lookup."""
+    user = await _create_user(async_session_factory)
+
+    async with async_session_factory() as db:
+        assert await UserRepository(db).change_password(user.id, PASSWORD, "NewSecret123!") is True
+
+    async with async_session_factory() as db:
+        reloaded = await UserRepository(db).get_user_by_email(user.email)
+
+    assert reloaded is not None
+    assert reloaded.hashedPassword != user.hashedPassword
+
+
+@pytest.mark.asyncio
+async def test_reset_token_carries_password_fingerprint(async_session_factory):
+    """Test that a reset token names the user and fingerprints the current password hash."""
+    user = await _create_user(async_session_factory)
+
+    async with async_session_factory() as db:
+        token = await UserRepository(db).generate_reset_token(user.email)
+
+    assert token is not None
+    payload = verify_token(token)
+    assert payload["type"] == "password_reset"
+    assert payload["sub"] == user.id
+    assert dict(payload)["pwh"] == password_fingerprint(user.hashedPassword)
+
+
+@pytest.mark.asyncio
+async def test_reset_token_not_issued_for_unknown_email(async_session_factory):
+    """Test that no reset token is generated for an unknown email."""
+    async with async_session_factory() as db:
+        assert await UserRepository(db).generate_reset_token("missing@example.com") is None
+
+
+@pytest.mark.asyncio
+async def test_reset_token_is_single_use(async_session_factory):
+    """Test that a reset token changes the password once and is rejected afterwards."""
+    user = await _create_user(async_session_factory)
+    async with async_session_factory() as db:
+        token = await UserRepository(db).generate_reset_token(user.email)
+    assert token is not None
+
+    async with async_session_factory() as db:
+        assert await UserRepository(db).reset_password_with_token(token, "NewSecret123!") is True
+
+    async with async_session_factory() as db:
+        repo = UserRepository(db)
+        assert await repo.reset_password_with_token(token, "OtherSecret123!") is False
+        reloaded = await repo.get_user_by_id(user.id)
+
+    assert reloaded is not None
+    assert reloaded.verify_password("NewSecret123!")
+
+
+@pytest.mark.asyncio
+async def test_reset_token_rejected_after_password_change(async_session_factory):
+    """Test that a reset token issued before a password change no longer works."""
+    user = await _create_user(async_session_factory)
+    async with async_session_factory() as db:
+        token = await UserRepository(db).generate_reset_token(user.email)
+    assert token is not None
+
+    async with async_session_factory() as db:
+        assert await UserRepository(db).change_password(user.id, PASSWORD, "NewSecret123!") is True
+
+    async with async_session_factory() as db:
+        repo = UserRepository(db)
+        assert await repo.reset_password_with_token(token, "OtherSecret123!") is False
+        reloaded = await repo.get_user_by_id(user.id)
+
+    assert reloaded is not None
+    assert reloaded.verify_password("NewSecret123!")
+
+
+@pytest.mark.asyncio
+async def test_reset_rejects_tokens_not_issued_for_reset(async_session_factory):
+    """Test that access tokens, tampered tokens and wrong fingerprints cannot reset a password."""
+    user = await _create_user(async_session_factory)
+    access_token = create_access_token({"sub": user.id, "email": user.email})
+    wrong_fingerprint = create_password_reset_token({"sub": user.id, "pwh": "0" * 16})
+
+    async with async_session_factory() as db:
+        repo = UserRepository(db)
+        assert await repo.reset_password_with_token(access_token, "NewSecret123!") is False
+        assert await repo.reset_password_with_token(wrong_fingerprint, "NewSecret123!") is False
+        assert await repo.reset_password_with_token(wrong_fingerprint[:-2], "NewSecret123!") is False
+        reloaded = await repo.get_user_by_id(user.id)
+
+    assert reloaded is not None
+    assert reloaded.verify_password(PASSWORD)
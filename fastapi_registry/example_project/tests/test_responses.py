@@ -0,0 +1,35 @@
+"""Test custom response classes and the exception handlers using them."""
+
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from app.core.app_factory import register_exception_handlers
+from app.core.responses import ORJSONResponse
+
+OVERSIZED_INT = 100000000000000000000000000000
+
+
+class Item(BaseModel):
+    name: str
+
+
+def test_render_falls_back_for_oversized_int():
+    """Content orjson rejects is still rendered with the standard encoder."""
+    response = ORJSONResponse(content={"value": OVERSIZED_INT})
+    assert response.body == b'{"value":100000000000000000000000000000}'
+
+
+def test_validation_error_with_oversized_int_returns_422():
+    """An oversized integer echoed back in a validation error must not cause a 500."""
+    app = FastAPI()
+    register_exception_handlers(app, is_development=False)
+
+    @app.post("/items")
+    async def create_item(item: Item) -> Item:
+        return item
+
+    client = TestClient(app, raise_server_exceptions=False)
+    response = client.post("/items", json={"name": OVERSIZED_INT})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert response.json()["details"][0]["input"] == OVERSIZED_INT
@@ -0,0 +1,170 @@
+"""Tests for the users list endpoint pagination."""
+
+from datetime import UTC, datetime
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.core.database import get_db
+
+# Needs the auth and users modules, which projects created by `init` start without
+pytest.importorskip("app.modules.auth")
+pytest.importorskip("app.modules.users")
+
+from app.modules.auth import auth_utils  # noqa: E402
+from app.modules.auth.repositories import UserRepository as AuthUserRepository  # noqa: E402
+from app.modules.users.dependencies import get_current_user  # noqa: E402
+from app.modules.users.models import User  # noqa: E402
+from app.modules.users.repositories import UserRepository  # noqa: E402
+from app.modules.users.router import router  # noqa: E402
+from app.modules.users.schemas import UserResponse  # noqa: E402
+
+USER_COUNT = 5
+
+
+@pytest.fixture(autouse=True)
+def fast_password_hashing(monkeypatch):
+    """Hash passwords at bcrypt's minimum cost, so tests creating users stay fast."""
+    monkeypatch.setattr(auth_utils, "BCRYPT_ROUNDS", 4)
+
+
+@pytest_asyncio.fixture
+async def users_client(async_session_factory):
+    """Create a client for the users router as an admin, with USER_COUNT users seeded.
+
+    Users are registered through the auth repository, which owns the password column of
+    the shared users table. Yields the client and the seeded user IDs in listing (ID) order.
+    """
+    async with async_session_factory() as db:
+        repo = AuthUserRepository(db)
+        users = [await repo.create_user(email=f"user{i}@example.com", password="Secret123!", full_name=f"User {i}") for i in range(USER_COUNT)]
+
+    async def override_get_db():
+        async with async_session_factory() as session:
+            yield session
+
+    now = datetime.now(UTC)
+    admin = User(id="admin", email="admin@example.com", name="Admin", role="admin", createdAt=now, updatedAt=now)
+
+    app = FastAPI()
+    app.include_router(router, prefix="/users")
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = lambda: admin
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client, sorted(user.id for user in users)
+
+
+@pytest.fixture
+def count_calls(monkeypatch):
+    """Record how many times the listing runs the COUNT query."""
+    calls = []
+    count_users = UserRepository.count_users
+
+    async def counting(self, *args, **kwargs):
+        calls.append(kwargs)
+        return await count_users(self, *args, **kwargs)
+
+    monkeypatch.setattr(UserRepository, "count_users", counting)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_page_smaller_than_limit_skips_count(users_client, count_calls):
+    """Test that a partial first page derives the total without a COUNT query."""
+    client, ids = users_client
+
+    response = await client.get("/users/", params={"limit": 10})
+
+    body = response.json()
+    assert response.status_code == 200
+    assert [user["id"] for user in body["users"]] == ids
+    assert body["total"] == USER_COUNT
+    assert count_calls == []
+
+
+@pytest.mark.asyncio
+async def test_full_page_counts_total(users_client, count_calls):
+    """Test that a full page runs COUNT, since more users may follow."""
+    client, ids = users_client
+
+    body = (await client.get("/users/", params={"limit": 2})).json()
+
+    assert [user["id"] for user in body["users"]] == ids[:2]
+    assert body["total"] == USER_COUNT
+    assert len(count_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_partial_last_page_with_skip_skips_count(users_client, count_calls):
+    """Test that the last page reached with skip derives the total as skip + page size."""
+    client, ids = users_client
+
+    body = (await client.get("/users/", params={"skip": 4, "limit": 2})).json()
+
+    assert [user["id"] for user in body["users"]] == ids[4:]
+    assert body["total"] == USER_COUNT
+    assert count_calls == []
+
+
+@pytest.mark.asyncio
+async def test_skip_past_end_counts_total(users_client, count_calls):
+    """Test that an empty page past the end still reports the real total."""
+    client, _ = users_client
+
+    body = (await client.get("/users/", params={"skip": 10, "limit": 2})).json()
+
+    assert body["users"] == []
+    assert body["total"] == USER_COUNT
+    assert len(count_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_after_cursor_returns_following_users(users_client, count_calls):
+    """Test that after returns users with greater IDs, with the total of the whole listing."""
+    client, ids = users_client
+
+    body = (await client.get("/users/", params={"after": ids[1], "limit": 10})).json()
+
+    assert [user["id"] for user in body["users"]] == ids[2:]
+    assert body["total"] == USER_COUNT
+    assert len(count_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_after_cursor_combined_with_skip(users_client):
+    """Test that skip applies after the cursor."""
+    client, ids = users_client
+
+    body = (await client.get("/users/", params={"after": ids[0], "skip": 1, "limit": 2})).json()
+
+    assert [user["id"] for user in body["users"]] == ids[2:4]
+    assert body["total"] == USER_COUNT
+    assert body["skip"] == 1
+
+
+@pytest.mark.asyncio
+async def test_after_last_id_returns_empty_page(users_client):
+    """Test that a cursor at the last user returns an empty page with the real total."""
+    client, ids = users_client
+
+    body = (await client.get("/users/", params={"after": ids[-1]})).json()
+
+    assert body["users"] == []
+    assert body["total"] == USER_COUNT
+
+
+@pytest.mark.asyncio
+async def test_current_user_matches_response_schema(users_client):
+    """Test that /me returns the current user in the UserResponse shape."""
+    client, _ = users_client
+
+    response = await client.get("/users/me")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert set(body) == set(UserResponse.model_fields)
+    assert body["id"] == "admin"
+    assert body["role"] == "admin"
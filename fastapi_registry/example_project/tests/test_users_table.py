@@ -0,0 +1,44 @@
+"""Tests for the users table shared by the auth and users modules."""
+
+import pytest
+from sqlalchemy import create_engine, insert, inspect
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.pool import StaticPool
+
+# Needs the auth and users modules, which projects created by `init` start without
+pytest.importorskip("app.modules.auth")
+pytest.importorskip("app.modules.users")
+
+from app.core.database import Base  # noqa: E402
+from app.modules.auth.db_models import UserDB as AuthUserDB  # noqa: E402
+from app.modules.users.db_models import UserDB as UsersUserDB  # noqa: E402
+
+
+@pytest.fixture
+def engine():
+    """Create the schema with both modules' models loaded."""
+    engine = create_engine("sqlite:///:memory:", poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+def test_users_module_extends_auth_table():
+    """Test that both modules map the same table."""
+    assert UsersUserDB.__table__ is AuthUserDB.__table__
+
+
+def test_email_index_created_once(engine):
+    """Test that extending the table does not declare a second email index."""
+    email_indexes = [index for index in inspect(engine).get_indexes("users") if index["column_names"] == ["email"]]
+    assert [(index["name"], bool(index["unique"])) for index in email_indexes] == [("ix_users_email", True)]
+
+
+def test_duplicate_email_rejected(engine):
+    """Test that the shared email index still enforces uniqueness."""
+    row = {"email": "user@example.com", "name": "Test User", "hashed_password": "hash", "role": "user"}
+    with engine.begin() as conn:
+        conn.execute(insert(AuthUserDB.__table__).values(id="user-1", **row))
+
+    with pytest.raises(IntegrityError), engine.begin() as conn:
+        conn.execute(insert(AuthUserDB.__table__).values(id="user-2", **row))
@@ -0,0 +1,89 @@
+"""Tests for ProjectInitializer."""
+
+from pathlib import Path
+
+import pytest
+
+from fastapi_registry.core.project_initializer import ProjectInitializer
+
+# Not valid UTF-8, and contains a placeholder-like sequence that must not be substituted
+BINARY_CONTENT = b"\x89PNG\r\n\x1a\n\xff\xfe{project_name}\x00"
+
+
+@pytest.fixture
+def base_path(tmp_path: Path) -> Path:
+    """Create a minimal registry package layout with an example project and templates."""
+    base = tmp_path / "registry"
+    example = base / "example_project"
+    (example / "app" / "core").mkdir(parents=True)
+    (example / "app" / "modules" / "auth").mkdir(parents=True)
+    (example / "app" / "common").mkdir(parents=True)
+    (example / "static").mkdir()
+
+    (example / "main.py").write_text('app_name = "{project_name}"\n', encoding="utf-8")
+    (example / "static" / "logo.png").write_bytes(BINARY_CONTENT)
+    (example / "README.md").write_text("Example project readme\n", encoding="utf-8")
+    (example / "app" / "core" / "config.py").write_text("EXAMPLE = True\n", encoding="utf-8")
+    (example / "app" / "modules" / "auth" / "router.py").write_text("# module\n", encoding="utf-8")
+    (example / "app" / "common" / "search.py").write_text("# common\n", encoding="utf-8")
+
+    templates = base / "templates_j2"
+    templates.mkdir()
+    (templates / "README.md.j2").write_text("# {project_name}\n\n{project_description}\n\nKeep {unknown} as is.\n", encoding="utf-8")
+    (templates / "config.py.j2").write_text('SECRET_KEY = "{secret_key}"\nDB = "{postgres_db}"\n', encoding="utf-8")
+    (templates / "Dockerfile.j2").write_bytes(b"FROM python:3.12-slim\r\n")
+
+    return base
+
+
+def test_init_project_renders_templates(base_path: Path, tmp_path: Path) -> None:
+    """Test that .j2 templates are rendered with the project's variables."""
+    project = tmp_path / "project"
+
+    ProjectInitializer(base_path).init_project(project, project_name="My_App", project_description="Zażółć gęślą jaźń")
+
+    readme = (project / "README.md").read_text(encoding="utf-8")
+    assert readme == "# My_App\n\nZażółć gęślą jaźń\n\nKeep {unknown} as is.\n"
+
+    config = (project / "app" / "core" / "config.py").read_text(encoding="utf-8")
+    assert "{secret_key}" not in config
+    assert 'DB = "my_app"' in config
+
+
+def test_init_project_copies_other_files_verbatim(base_path: Path, tmp_path: Path) -> None:
+    """Test that non-template files, including binary ones, are copied byte for byte."""
+    project = tmp_path / "project"
+
+    ProjectInitializer(base_path).init_project(project, project_name="demo")
+
+    assert (project / "static" / "logo.png").read_bytes() == BINARY_CONTENT
+    # Only .j2 templates are rendered; placeholders in other files are left alone
+    assert (project / "main.py").read_text(encoding="utf-8") == 'app_name = "{project_name}"\n'
+    # Templates without placeholders are copied unchanged
+    assert (project / "Dockerfile").read_bytes() == b"FROM python:3.12-slim\r\n"
+
+
+def test_init_project_skips_modules_and_templated_files(base_path: Path, tmp_path: Path) -> None:
+    """Test that modules, common utilities and files replaced by templates are not copied."""
+    project = tmp_path / "project"
+
+    ProjectInitializer(base_path).init_project(project, project_name="demo")
+
+    assert not (project / "app" / "modules" / "auth").exists()
+    assert not (project / "app" / "common").exists()
+    assert (project / "app" / "modules" / "__init__.py").is_file()
+    assert "Example project readme" not in (project / "README.md").read_text(encoding="utf-8")
+    assert "EXAMPLE" not in (project / "app" / "core" / "config.py").read_text(encoding="utf-8")
+
+
+def test_init_project_refuses_non_empty_directory(base_path: Path, tmp_path: Path) -> None:
+    """Test that a non-empty target directory is rejected unless forced."""
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "existing.txt").write_text("keep", encoding="utf-8")
+
+    with pytest.raises(FileExistsError):
+        ProjectInitializer(base_path).init_project(project, project_name="demo")
+
+    ProjectInitializer(base_path).init_project(project, project_name="demo", force=True)
+    assert (project / "existing.txt").read_text(encoding="utf-8") == "keep"